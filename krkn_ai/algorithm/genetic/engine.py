@@ -29,6 +29,12 @@ from krkn_ai.utils.weight_learning import learn_weights, save_learned_weights
 
 LEARNED_WEIGHTS_FILE = "learned_weights.json"
 
+_COMPOSITE_DEPENDENCIES = (
+    CompositeDependency.NONE,
+    CompositeDependency.A_ON_B,
+    CompositeDependency.B_ON_A,
+)
+
 logger = get_logger(__name__)
 
 
@@ -363,9 +369,12 @@ class GeneticAlgorithm(BaseEngine):
 
     def scenario_mutation(self, scenario: BaseScenario):
         common_scenarios = []
+        active_components = self.config.cluster_components.get_active_components()
         for _, scenario_cls in self.valid_scenarios:
-            new_scenario = scenario_cls(
-                cluster_components=self.config.cluster_components.get_active_components()
+            # Only the chosen candidate needs parameter values, so skip mutating
+            # the rest.
+            new_scenario = scenario_cls.construct_trusted(
+                cluster_components=active_components, mutate_on_init=False
             )
 
             common_params = set([type(x) for x in new_scenario.parameters]) & set(
@@ -379,6 +388,7 @@ class GeneticAlgorithm(BaseEngine):
             return False, scenario
 
         new_scenario = rng.choice(common_scenarios)
+        new_scenario.mutate()
 
         common_params = set([type(x) for x in new_scenario.parameters]) & set(
             [type(x) for x in scenario.parameters]
@@ -485,13 +495,7 @@ class GeneticAlgorithm(BaseEngine):
             return scenario_a, scenario_b
 
     def composition(self, scenario_a: BaseScenario, scenario_b: BaseScenario):
-        dependency = rng.choice(
-            [
-                CompositeDependency.NONE,
-                CompositeDependency.A_ON_B,
-                CompositeDependency.B_ON_A,
-            ]
-        )
+        dependency = rng.pick(_COMPOSITE_DEPENDENCIES)
         composite_scenario = CompositeScenario(
             name="composite",
             scenario_a=scenario_a,
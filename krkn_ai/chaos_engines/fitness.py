@@ -88,7 +88,11 @@ class FitnessCalculator:
                 if not series_list or not series_list[0].get("values"):
                     if attempt < retries - 1:
                         logger.warning(
-                            f"Pre-flight check: query '{query}' returned no data. Retrying... ({attempt + 1}/{retries})"
+                            "Pre-flight check: query '%s' returned no data. "
+                            "Retrying... (%d/%d)",
+                            query,
+                            attempt + 1,
+                            retries,
                         )
                         time.sleep(retry_delay)
                         continue
@@ -105,7 +109,10 @@ class FitnessCalculator:
             except Exception as e:
                 if attempt < retries - 1:
                     logger.warning(
-                        f"Pre-flight check errored: {e}. Retrying... ({attempt + 1}/{retries})"
+                        "Pre-flight check errored: %s. Retrying... (%d/%d)",
+                        e,
+                        attempt + 1,
+                        retries,
                     )
                     time.sleep(retry_delay)
                     continue
@@ -131,9 +138,11 @@ class FitnessCalculator:
             except FitnessFunctionConfigurationError:
                 raise
             except Exception as error:
-                logger.error(f"Fitness function calculation failed: {error}")
+                logger.error("Fitness function calculation failed: %s", error)
                 logger.info(
-                    f"Retrying fitness function calculation... (retry {retry + 1} of {retries})"
+                    "Retrying fitness function calculation... (retry %d of %d)",
+                    retry + 1,
+                    retries,
                 )
                 time.sleep(retry_delay)
         raise FitnessFunctionCalculationError(
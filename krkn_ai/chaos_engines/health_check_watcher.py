@@ -43,7 +43,8 @@ class HealthCheckWatcher:
     def run(self):
         # Start a thread for each health check
         logger.debug(
-            f"Starting health check watcher for {len(self.config.applications)} applications"
+            "Starting health check watcher for %d applications",
+            len(self.config.applications),
         )
         for health_check in self.config.applications:
             t = threading.Thread(
@@ -151,7 +152,7 @@ class HealthCheckWatcher:
             return 0
         failed = sum(1 for r in all_results if not r.success)
         score = (failed / total) * 10
-        logger.debug(f"Health check failure rate score: {score}")
+        logger.debug("Health check failure rate score: %s", score)
         return score
 
     def summarize_response_time(
@@ -179,5 +180,5 @@ class HealthCheckWatcher:
         if total == 0:
             return 0.0
         score = (score / total) * 10.0
-        logger.debug(f"Response time outlier score: {score}")
+        logger.debug("Response time outlier score: %s", score)
         return score
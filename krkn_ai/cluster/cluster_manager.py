@@ -1,11 +1,11 @@
 import re
+import json
 import ipaddress
 import concurrent.futures
 from typing import Dict, List, Optional, Union
 
 import requests
 from krkn_lib.k8s.krkn_kubernetes import KrknKubernetes
-from kubernetes.client.models import V1PodSpec
 from kubernetes.client.rest import ApiException
 from krkn_ai.utils import run_shell
 from krkn_ai.utils.logger import get_logger
@@ -26,6 +26,9 @@ from krkn_ai.models.cluster_components import VMI
 
 logger = get_logger(__name__)
 
+# Thread pool size for concurrent Kubernetes API calls during discovery.
+_DISCOVERY_WORKERS = 20
+
 # Network interface name prefixes that are valid targets for network chaos.
 # Covers classic and predictable NIC names, bonds, bridges, InfiniBand and
 # wireless across bare-metal, cloud and OpenShift nodes. (#294)
@@ -42,6 +45,26 @@ _TARGETABLE_INTERFACE_PREFIXES = (
 # biosdevname-style PCI NICs (e.g. p2p1, p1p1). Matched separately from the
 # prefix tuple so a bare "p" doesn't admit non-physical names like "ppp0". (#294)
 _PCI_INTERFACE_RE = re.compile(r"^p\d")
+_PLAIN_NUMBER_RE = re.compile(r"^\d+(\.\d+)?$")
+_MEMORY_QUANTITY_RE = re.compile(r"^([0-9.]+)\s*([a-zA-Z]+)$")
+
+# Kubernetes memory quantity suffixes, binary (Ki, Mi, ...) and SI (K, M, ...).
+_MEMORY_POWER2 = {
+    "Ki": 1024,
+    "Mi": 1024**2,
+    "Gi": 1024**3,
+    "Ti": 1024**4,
+    "Pi": 1024**5,
+    "Ei": 1024**6,
+}
+_MEMORY_POWER10 = {
+    "K": 1000,
+    "M": 1000**2,
+    "G": 1000**3,
+    "T": 1000**4,
+    "P": 1000**5,
+    "E": 1000**6,
+}
 
 # Virtual / internal interfaces that must never be disrupted, even when they
 # share a prefix with a targetable one (e.g. "podman0" starts with "p", and the
@@ -100,18 +123,24 @@ class ClusterManager:
         """
         namespaces = self.list_namespaces(namespace_pattern)
 
-        for i, namespace in enumerate(namespaces):
-            pods = self.list_pods(namespace, pod_label_pattern, skip_pod_name)
-            namespaces[i].pods = pods
-            namespaces[i].services = self.list_services(namespace)
-            namespaces[i].pvcs = self.list_pvcs(namespace)
-
-            vmis = self.list_vmis(namespace)
-            namespaces[i].vmis = vmis
-
-        return ClusterComponents(
-            namespaces=namespaces, nodes=self.list_nodes(node_label_pattern)
-        )
+        def populate_namespace(namespace: Namespace) -> None:
+            namespace.pods = self.list_pods(namespace, pod_label_pattern, skip_pod_name)
+            namespace.services = self.list_services(namespace)
+            namespace.pvcs = self.list_pvcs(namespace)
+            namespace.vmis = self.list_vmis(namespace)
+
+        # Discovery is a chain of blocking API round trips per namespace, so
+        # namespaces are listed concurrently, alongside the (slower) node
+        # discovery which shells out per node.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_DISCOVERY_WORKERS
+        ) as executor:
+            nodes_future = executor.submit(self.list_nodes, node_label_pattern)
+            # map() preserves namespace order and re-raises the first failure
+            list(executor.map(populate_namespace, namespaces))
+            nodes = nodes_future.result()
+
+        return ClusterComponents(namespaces=namespaces, nodes=nodes)
 
     def list_namespaces(
         self, namespace_pattern: Optional[str] = None
@@ -198,36 +227,51 @@ class ClusterManager:
             skip_pod_name_patterns, default_match_all=False
         )
 
-        pods = self.core_api.list_namespaced_pod(
-            namespace=namespace.name, field_selector="status.phase=Running"
-        ).items
+        # Read the raw response and walk the JSON directly: only names, labels,
+        # owners and container names are needed, so building the full
+        # kubernetes client models for every pod is wasted work.
+        response = self.core_api.list_namespaced_pod(
+            namespace=namespace.name,
+            field_selector="status.phase=Running",
+            _preload_content=False,
+        )
+        pods = json.loads(response.data).get("items") or []
         pod_list = []
 
         for pod in pods:
+            # The API server always sets metadata.name on listed objects
+            metadata = pod["metadata"]
+            pod_name: str = metadata["name"]
+
             # Skip if podname matches skip pattern
-            if skip_matcher.matches(pod.metadata.name):
+            if skip_matcher.matches(pod_name):
                 logger.debug(
-                    "Skipping pod %s in namespace %s", pod.metadata.name, namespace.name
+                    "Skipping pod %s in namespace %s", pod_name, namespace.name
                 )
                 continue
 
             owner = None
-            if pod.metadata.owner_references:
-                ref = pod.metadata.owner_references[0]
-                owner = OwnerReference(name=ref.name, kind=ref.kind)
+            owner_references = metadata.get("ownerReferences")
+            if owner_references:
+                ref = owner_references[0]
+                owner = OwnerReference(name=ref.get("name"), kind=ref.get("kind"))
 
-            pod_component = Pod(
-                name=pod.metadata.name,
-                owner=owner,
-            )
             # Filter label keys by patterns
             labels = {}
-            if pod.metadata.labels is not None:
-                for label_key, label_value in pod.metadata.labels.items():
+            if metadata.get("labels") is not None:
+                for label_key, label_value in metadata["labels"].items():
                     if label_matcher.matches(label_key):
                         labels[label_key] = label_value
-            pod_component.labels = labels
-            pod_component.containers = self.list_containers(pod.spec)
+
+            containers = self.list_containers(pod.get("spec") or {})
+
+            # Pass labels at construction so they go through validation (interning)
+            pod_component = Pod(
+                name=pod_name,
+                labels=labels,
+                containers=containers,
+                owner=owner,
+            )
             pod_list.append(pod_component)
 
         logger.debug("Filtered %d pods in namespace %s", len(pod_list), namespace.name)
@@ -423,12 +467,13 @@ class ClusterManager:
             )
             return []
 
-    def list_containers(self, pod_spec: V1PodSpec) -> List[Container]:
+    def list_containers(self, pod_spec: dict) -> List[Container]:
+        # pod_spec is the raw JSON spec of a pod, as read by list_pods
         containers = []
-        for container in pod_spec.containers:
+        for container in pod_spec.get("containers") or []:
             containers.append(
                 Container(
-                    name=container.name,
+                    name=container.get("name"),
                 )
             )
         return containers
@@ -511,9 +556,7 @@ class ClusterManager:
             hostname_key = "kubernetes.io/hostname"
             if not label_matcher.matches(hostname_key):
                 # Add hostname pattern to the matcher
-                label_matcher.include_patterns.append(
-                    PatternMatcher._compile_pattern(hostname_key)
-                )
+                label_matcher.add_include(hostname_key)
 
         nodes = self.core_api.list_node().items
 
@@ -586,7 +629,9 @@ class ClusterManager:
 
         node_list = []
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_DISCOVERY_WORKERS
+        ) as executor:
             futures = [executor.submit(process_node, node) for node in nodes]
             for future in concurrent.futures.as_completed(futures):
                 result = future.result()
@@ -594,7 +639,11 @@ class ClusterManager:
                     node_list.append(result)
 
         if node_list:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
+            # Each lookup waits seconds on an `oc debug` pod being scheduled,
+            # so size the pool for I/O rather than by the local CPU count.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=_DISCOVERY_WORKERS
+            ) as executor:
                 future_to_node = {
                     executor.submit(self.list_node_interfaces, node.name): node
                     for node in node_list
@@ -694,43 +743,26 @@ class ClusterManager:
         '512M'      -> 512_000_000
         '1024'      -> 1024
         """
-        _mem_power2 = {
-            "Ki": 1024,
-            "Mi": 1024**2,
-            "Gi": 1024**3,
-            "Ti": 1024**4,
-            "Pi": 1024**5,
-            "Ei": 1024**6,
-        }
-        _mem_power10 = {
-            "K": 1000,
-            "M": 1000**2,
-            "G": 1000**3,
-            "T": 1000**4,
-            "P": 1000**5,
-            "E": 1000**6,
-        }
-
         if mem_str is None:
             return 0
         s = str(mem_str).strip()
-        if re.fullmatch(r"^\d+(\.\d+)?$", s):
+        if _PLAIN_NUMBER_RE.fullmatch(s):
             return int(float(s))
-        m = re.fullmatch(r"^([0-9.]+)\s*([a-zA-Z]+)$", s)
+        m = _MEMORY_QUANTITY_RE.fullmatch(s)
         if not m:
             raise ValueError(f"Unable to parse memory string: {s}")
         val = float(m.group(1))
         unit = m.group(2)
         # binary units
-        if unit in _mem_power2:
-            return int(val * _mem_power2[unit])
+        if unit in _MEMORY_POWER2:
+            return int(val * _MEMORY_POWER2[unit])
         # SI units
-        if unit in _mem_power10:
-            return int(val * _mem_power10[unit])
+        if unit in _MEMORY_POWER10:
+            return int(val * _MEMORY_POWER10[unit])
         # case-insensitive fallback
         u_uc = unit.capitalize()
-        if u_uc in _mem_power2:
-            return int(val * _mem_power2[u_uc])
-        if u_uc in _mem_power10:
-            return int(val * _mem_power10[u_uc])
+        if u_uc in _MEMORY_POWER2:
+            return int(val * _MEMORY_POWER2[u_uc])
+        if u_uc in _MEMORY_POWER10:
+            return int(val * _MEMORY_POWER10[u_uc])
         raise ValueError(f"Unknown memory unit: {unit}")
@@ -6,10 +6,9 @@ their metadata.
 """
 
 import json
-from collections import Counter
 from dataclasses import dataclass
-from typing import List, Set, Optional
-from krkn_ai.models.cluster_components import Node
+from typing import Dict, List, Mapping, Optional, Sequence
+from krkn_ai.models.cluster_components import Node, build_node_label_index
 from krkn_ai.utils.rng import rng
 from krkn_ai.utils.logger import get_logger
 
@@ -26,7 +25,11 @@ class NodeSelectionResult:
     matching_nodes: List[Node]  # Actual nodes matching the selector
 
 
-def select_nodes(nodes: List[Node]) -> NodeSelectionResult:
+def select_nodes(
+    nodes: List[Node],
+    label_index: Optional[Dict[str, Sequence[Node]]] = None,
+    label_keys: Optional[Sequence[str]] = None,
+) -> NodeSelectionResult:
     """
     Select nodes for chaos injection using two strategies randomly.
 
@@ -36,6 +39,11 @@ def select_nodes(nodes: List[Node]) -> NodeSelectionResult:
 
     Args:
         nodes: List of available nodes in the cluster
+        label_index: Optional precomputed "key=value" -> matching nodes index
+            for ``nodes`` (see ClusterComponents.node_label_index). Built on
+            the fly when not provided.
+        label_keys: Optional precomputed sequence of ``label_index`` keys (see
+            ClusterComponents.node_label_keys).
 
     Returns:
         NodeSelectionResult with node selector, count, taints, and matched nodes
@@ -46,13 +54,14 @@ def select_nodes(nodes: List[Node]) -> NodeSelectionResult:
     if not nodes:
         raise ValueError("No nodes available for selection")
 
-    all_labels: Counter[str] = Counter()
-    for node in nodes:
-        for label_key, label_value in node.labels.items():
-            all_labels[f"{label_key}={label_value}"] += 1
+    all_labels: Mapping[str, Sequence[Node]] = (
+        label_index if label_index is not None else build_node_label_index(nodes)
+    )
 
     logger.debug(
-        f"Found {len(all_labels)} unique label combinations across {len(nodes)} nodes"
+        "Found %d unique label combinations across %d nodes",
+        len(all_labels),
+        len(nodes),
     )
 
     # Strategy 1: Random node selection (50% probability, or if no labels available)
@@ -63,19 +72,17 @@ def select_nodes(nodes: List[Node]) -> NodeSelectionResult:
         selected_node = rng.choice(nodes)
         node_selector = f"kubernetes.io/hostname={selected_node.name}"
         number_of_nodes = 1
-        taints_json = _serialize_taints(selected_node.taints)
+        taints_json = selected_node.taints_json
         matching_nodes = [selected_node]
 
-        logger.debug(f"Selected random node: {selected_node.name}")
+        logger.debug("Selected random node: %s", selected_node.name)
     else:
         # Strategy 2: Label/value selection
-        selected_label = rng.choice(list(all_labels.keys()))
+        if label_keys is None:
+            label_keys = tuple(all_labels)
+        selected_label = rng.choice(label_keys)
         node_selector = selected_label
-        label_key, label_value = selected_label.split("=", 1)
-
-        all_matching_nodes = [
-            n for n in nodes if n.labels.get(label_key) == label_value
-        ]
+        all_matching_nodes = all_labels[selected_label]
 
         count = rng.randint(1, len(all_matching_nodes))
         selected_nodes = rng.sample(all_matching_nodes, k=count)
@@ -83,9 +90,10 @@ def select_nodes(nodes: List[Node]) -> NodeSelectionResult:
         taints_json = _collect_taints_from_nodes(selected_nodes)
 
         logger.debug(
-            f"Selected label {selected_label}: "
-            f"found {len(all_matching_nodes)} matching nodes, "
-            f"selecting {count}"
+            "Selected label %s: found %d matching nodes, selecting %d",
+            selected_label,
+            len(all_matching_nodes),
+            count,
         )
 
         matching_nodes = selected_nodes
@@ -99,12 +107,7 @@ def select_nodes(nodes: List[Node]) -> NodeSelectionResult:
     )
 
 
-def _serialize_taints(taints: Optional[List[str]]) -> str:
-    """Convert taints list to JSON string."""
-    return json.dumps(taints if taints else [])
-
-
-def _collect_taints_from_nodes(nodes: List[Node]) -> str:
+def _collect_taints_from_nodes(nodes: Sequence[Node]) -> str:
     """
     Collect unique taints from multiple nodes.
 
@@ -114,15 +117,12 @@ def _collect_taints_from_nodes(nodes: List[Node]) -> str:
     Returns:
         JSON string representation of deduplicated taints
     """
-    seen_taints_json: Set[str] = set()
-    all_taints: List = []
-
-    for node in nodes:
-        if node.taints:
-            for taint in node.taints:
-                taint_json = json.dumps(taint, sort_keys=True)
-                if taint_json not in seen_taints_json:
-                    seen_taints_json.add(taint_json)
-                    all_taints.append(taint)
-
-    return json.dumps(all_taints)
+    if len(nodes) == 1:
+        return nodes[0].taints_json
+
+    # Taints are "key[=value]:effect" strings, so they deduplicate as-is.
+    unique_taints = dict.fromkeys(taint for node in nodes for taint in node.taints)
+    if not unique_taints:
+        # Most worker nodes are untainted; skip the encoder for the common case.
+        return "[]"
+    return json.dumps(list(unique_taints))
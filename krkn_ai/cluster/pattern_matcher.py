@@ -10,7 +10,7 @@ Supports:
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Union
+from typing import List, Optional, Set, Tuple, Union
 
 from krkn_ai.utils.logger import get_logger
 
@@ -38,6 +38,14 @@ class PatternMatcher:
     exclude_patterns: List[re.Pattern] = field(default_factory=list)
     match_all: bool = False
 
+    # Merged forms of the pattern lists used by matches(), built on first use.
+    _include: Optional[Tuple[re.Pattern, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _exclude: Optional[Tuple[re.Pattern, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_string(
         cls,
@@ -158,6 +166,32 @@ class PatternMatcher:
         except re.error as e:
             raise PatternValidationError(f"Invalid regex pattern '{pattern}': {e}")
 
+    @staticmethod
+    def _merge_patterns(patterns: List[re.Pattern]) -> Tuple[re.Pattern, ...]:
+        """
+        Merge patterns into a single alternation so each value is scanned once.
+
+        Patterns with capture groups are kept separate, since merging them
+        would renumber their backreferences.
+        """
+        if len(patterns) < 2 or any(p.groups for p in patterns):
+            return tuple(patterns)
+        try:
+            return (re.compile("|".join(f"(?:{p.pattern})" for p in patterns)),)
+        except re.error:
+            # e.g. inline global flags, which must lead the whole expression
+            return tuple(patterns)
+
+    def add_include(self, pattern: str) -> None:
+        """
+        Add an inclusion pattern to an existing matcher.
+
+        Args:
+            pattern: The pattern string to compile and include
+        """
+        self.include_patterns.append(self._compile_pattern(pattern))
+        self._include = None
+
     def matches(self, value: str) -> bool:
         """
         Check if a value matches the pattern criteria.
@@ -173,8 +207,12 @@ class PatternMatcher:
         Returns:
             True if value matches, False otherwise
         """
+        if self._include is None or self._exclude is None:
+            self._include = self._merge_patterns(self.include_patterns)
+            self._exclude = self._merge_patterns(self.exclude_patterns)
+
         # Check exclusions first - they take priority
-        for exc in self.exclude_patterns:
+        for exc in self._exclude:
             if exc.match(value):
                 return False
 
@@ -183,7 +221,7 @@ class PatternMatcher:
             return True
 
         # Check inclusion patterns
-        for inc in self.include_patterns:
+        for inc in self._include:
             if inc.match(value):
                 return True
 
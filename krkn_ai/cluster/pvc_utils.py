@@ -2,7 +2,8 @@
 Kubernetes resource utilities: PVC usage lookups and pod name resolution.
 """
 
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
+import shlex
 import time
 from krkn_lib.k8s.krkn_kubernetes import KrknKubernetes
 from krkn_lib.telemetry.k8s import KrknTelemetryKubernetes
@@ -19,6 +20,14 @@ _pvc_usage_cache: Dict[Tuple[str, str], Tuple[float, float]] = {}
 _cache_ttl = 5.0  # Cache TTL in seconds
 _logged_pvcs: set = set()
 
+# Per-namespace index of PVC name -> (pod name, volume name), shares the TTL above
+_pvc_mount_cache: Dict[str, Tuple[Dict[str, Tuple[str, str]], float]] = {}
+
+# Kubernetes clients per kubeconfig path. Building one re-reads the kubeconfig
+# and sets up a fresh connection pool, so they are reused across lookups.
+_kubernetes_clients: Dict[str, KrknKubernetes] = {}
+_telemetry_clients: Dict[str, KrknTelemetryKubernetes] = {}
+
 
 def initialize_kubeconfig(kubeconfig_path: str):
     """
@@ -32,6 +41,69 @@ def initialize_kubeconfig(kubeconfig_path: str):
     _kubeconfig_path = kubeconfig_path
 
 
+def _get_kubernetes(kubeconfig_path: str) -> KrknKubernetes:
+    """Return the cached Kubernetes client for a kubeconfig."""
+    lib_kubernetes = _kubernetes_clients.get(kubeconfig_path)
+    if lib_kubernetes is None:
+        lib_kubernetes = KrknKubernetes(kubeconfig_path=kubeconfig_path)
+        _kubernetes_clients[kubeconfig_path] = lib_kubernetes
+    return lib_kubernetes
+
+
+def _get_telemetry(kubeconfig_path: str) -> KrknTelemetryKubernetes:
+    """Return the cached telemetry client for a kubeconfig."""
+    lib_telemetry = _telemetry_clients.get(kubeconfig_path)
+    if lib_telemetry is None:
+        lib_telemetry = KrknTelemetryKubernetes(
+            safe_logger=SafeLogger(),
+            lib_kubernetes=_get_kubernetes(kubeconfig_path),
+        )
+        _telemetry_clients[kubeconfig_path] = lib_telemetry
+    return lib_telemetry
+
+
+def _get_pvc_mounts(
+    namespace: str, lib_kubernetes: KrknKubernetes, current_time: float
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Map each PVC mounted by a running pod in the namespace to the first such
+    pod and its volume name. One pod listing serves every PVC in the namespace.
+    """
+    if namespace in _pvc_mount_cache:
+        cached_mounts, cached_timestamp = _pvc_mount_cache[namespace]
+        if current_time - cached_timestamp < _cache_ttl:
+            return cached_mounts
+
+    pods = lib_kubernetes.cli.list_namespaced_pod(
+        namespace=namespace, field_selector="status.phase=Running"
+    ).items
+
+    mounts: Dict[str, Tuple[str, str]] = {}
+    for pod in pods:
+        for volume in pod.spec.volumes or []:
+            if volume.persistent_volume_claim:
+                mounts.setdefault(
+                    volume.persistent_volume_claim.claim_name,
+                    (pod.metadata.name, volume.name),
+                )
+    _pvc_mount_cache[namespace] = (mounts, current_time)
+    return mounts
+
+
+def _split_df_rows(output: str, count: int) -> Optional[List[List[str]]]:
+    """
+    Split `df <paths> | sed 1d` output into one field list per probed path.
+    Rows are paired by field count rather than by line, since some df builds
+    wrap long filesystem names onto their own line.
+    """
+    fields = output.split()
+    if count == 1:
+        return [fields]
+    if len(fields) != 6 * count:
+        return None
+    return [fields[i : i + 6] for i in range(0, len(fields), 6)]
+
+
 def resolve_pod_name(
     namespace: str,
     pod_name: str,
@@ -68,8 +140,8 @@ def resolve_pod_name(
         return pod_name
 
     try:
-        krkn_k8s = KrknKubernetes(kubeconfig_path=kubeconfig_path)
-        live_pods = krkn_k8s.cli.list_namespaced_pod(
+        lib_kubernetes = _get_kubernetes(kubeconfig_path)
+        live_pods = lib_kubernetes.cli.list_namespaced_pod(
             namespace=namespace,
             field_selector="status.phase=Running",
         ).items
@@ -101,7 +173,7 @@ def resolve_pod_name(
             "Failed to resolve pod name for %s in %s: %s",
             pod_name,
             namespace,
-            str(e),
+            e,
         )
         return pod_name
 
@@ -141,38 +213,18 @@ def get_pvc_usage_percentage(
             _logged_pvcs.discard(cache_key)
 
     try:
-        safe_logger = SafeLogger()
-        lib_kubernetes = KrknKubernetes(kubeconfig_path=kubeconfig_path)
-        lib_telemetry = KrknTelemetryKubernetes(
-            safe_logger=safe_logger, lib_kubernetes=lib_kubernetes
-        )
+        lib_kubernetes = _get_kubernetes(kubeconfig_path)
+        lib_telemetry = _get_telemetry(kubeconfig_path)
 
         # Find a pod that uses this PVC (we know pvc_name, need to find pod_name)
-        krkn_k8s = KrknKubernetes(kubeconfig_path=kubeconfig_path)
-        pods = krkn_k8s.cli.list_namespaced_pod(
-            namespace=namespace, field_selector="status.phase=Running"
-        ).items
-
-        pod_name = None
-        volume_name = None
-        for pod in pods:
-            if pod.spec.volumes:
-                for volume in pod.spec.volumes:
-                    if (
-                        volume.persistent_volume_claim
-                        and volume.persistent_volume_claim.claim_name == pvc_name
-                    ):
-                        pod_name = pod.metadata.name
-                        volume_name = volume.name
-                        break
-                if pod_name:
-                    break
-
-        if not pod_name or not volume_name:
+        mounts = _get_pvc_mounts(namespace, lib_kubernetes, current_time)
+        mount = mounts.get(pvc_name)
+        if mount is None:
             logger.debug(
                 "No running pod found using PVC %s in namespace %s", pvc_name, namespace
             )
             return None
+        pod_name, volume_name = mount
 
         # Get pod info (following reference code pattern exactly)
         pod = lib_telemetry.get_lib_kubernetes().get_pod_info(
@@ -185,57 +237,86 @@ def get_pvc_usage_percentage(
         # Get container name and mount path (following reference code pattern exactly)
         mount_path = None
         container_name = None
+        volume_mounts = []
         for container in pod.containers:
             for vol in container.volumeMounts:
                 if vol.name == volume_name:
                     mount_path = vol.mountPath
                     container_name = container.name
+                    volume_mounts = container.volumeMounts
                     break
 
         if not mount_path or not container_name:
             logger.debug("No mount path found for PVC %s in pod %s", pvc_name, pod_name)
             return None
 
-        # Get PVC capacity and used bytes (following reference code pattern exactly)
-        command = "df %s -B 1024 | sed 1d" % (str(mount_path))
-        command_output = (
-            lib_telemetry.get_lib_kubernetes().exec_cmd_in_pod(
+        # Probe the other PVCs this container mounts in the same exec, so that
+        # lookups for them within the TTL are answered from the cache.
+        claims_by_volume = {
+            volume: claim
+            for claim, (owner_pod, volume) in mounts.items()
+            if owner_pod == pod_name and claim != pvc_name
+        }
+        probes = [(pvc_name, mount_path)] + [
+            (claims_by_volume[vol.name], vol.mountPath)
+            for vol in volume_mounts
+            if vol.name in claims_by_volume
+        ]
+
+        def run_df(paths: List[str]) -> str:
+            # Get PVC capacity and used bytes (following reference code pattern)
+            command = "df %s -B 1024 | sed 1d" % " ".join(
+                shlex.quote(str(path)) for path in paths
+            )
+            return lib_telemetry.get_lib_kubernetes().exec_cmd_in_pod(
                 [command], pod_name, namespace, container_name
             )
-        ).split()
 
-        if len(command_output) < 4:
-            logger.debug(
-                "Unexpected df output format for PVC %s: %s", pvc_name, command_output
-            )
-            return None
+        rows = _split_df_rows(run_df([path for _, path in probes]), len(probes))
+        if rows is None:
+            # Rows can't be paired with paths; probe the requested PVC alone
+            probes = probes[:1]
+            rows = [run_df([mount_path]).split()]
+
+        current_usage = None
+        for (claim_name, _), command_output in zip(probes, rows):
+            if len(command_output) < 4:
+                logger.debug(
+                    "Unexpected df output format for PVC %s: %s",
+                    claim_name,
+                    command_output,
+                )
+                continue
 
-        pvc_used_kb = int(command_output[2])
-        pvc_capacity_kb = pvc_used_kb + int(command_output[3])
+            pvc_used_kb = int(command_output[2])
+            pvc_capacity_kb = pvc_used_kb + int(command_output[3])
 
-        if pvc_capacity_kb > 0:
-            current_usage = (pvc_used_kb / pvc_capacity_kb) * 100
+            if pvc_capacity_kb <= 0:
+                logger.debug("PVC %s capacity is 0, cannot calculate usage", claim_name)
+                continue
+
+            usage = (pvc_used_kb / pvc_capacity_kb) * 100
+            claim_key = (namespace, claim_name)
             # Cache the result
-            _pvc_usage_cache[cache_key] = (current_usage, current_time)
+            _pvc_usage_cache[claim_key] = (usage, current_time)
             # Only log once per PVC to reduce log noise
-            if cache_key not in _logged_pvcs:
+            if claim_key not in _logged_pvcs:
                 logger.info(
                     "Found PVC %s usage: %.2f%% (used: %d KB, capacity: %d KB)",
-                    pvc_name,
-                    current_usage,
+                    claim_name,
+                    usage,
                     pvc_used_kb,
                     pvc_capacity_kb,
                 )
-                _logged_pvcs.add(cache_key)
-            return current_usage
-        else:
-            logger.debug("PVC %s capacity is 0, cannot calculate usage", pvc_name)
-            return None
+                _logged_pvcs.add(claim_key)
+            if claim_name == pvc_name:
+                current_usage = usage
+        return current_usage
     except Exception as e:
         logger.debug(
             "Failed to get usage for PVC %s in namespace %s: %s",
             pvc_name,
             namespace,
-            str(e),
+            e,
         )
         return None
@@ -1,51 +1,227 @@
-from typing import Dict, List, Optional, Union
-from pydantic import BaseModel
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from pydantic import BaseModel, PrivateAttr, field_validator
 
 
-class Container(BaseModel):
+# Bumped whenever a component model below is edited: a field reassigned, or
+# one of its lists or dicts changed in place. Cached indices remember the
+# version they were built against and are dropped once it moves on, so a parent
+# also notices edits made to its children. Components are edited while the
+# snapshot is discovered and configured, not while scenarios are generated, so
+# one shared counter only costs rebuilds before the indices are in use.
+_components_version = 0
+
+
+def _bump_components_version() -> None:
+    global _components_version
+    _components_version += 1
+
+
+def _bumping(method):
+    def edit(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        _bump_components_version()
+        return result
+
+    edit.__name__ = method.__name__
+    return edit
+
+
+class _TrackedList(list):
+    """List field value that drops cached component indices when edited in place."""
+
+    __slots__ = ()
+
+
+class _TrackedDict(dict):
+    """Dict field value that drops cached component indices when edited in place."""
+
+    __slots__ = ()
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_TrackedList, _name, _bumping(getattr(list, _name)))
+
+for _name in (
+    "pop",
+    "popitem",
+    "clear",
+    "update",
+    "setdefault",
+    "__setitem__",
+    "__delitem__",
+    "__ior__",
+):
+    setattr(_TrackedDict, _name, _bumping(getattr(dict, _name)))
+
+
+def _tracked(value):
+    if type(value) is list:
+        return _TrackedList(value)
+    if type(value) is dict:
+        return _TrackedDict(value)
+    return value
+
+
+def _intern_labels(labels: Dict[str, str]) -> Dict[str, str]:
+    """Intern label keys/values so repeated labels share a single string object."""
+    return _TrackedDict((sys.intern(k), sys.intern(v)) for k, v in labels.items())
+
+
+def _label_selectors(labels: Dict[str, str]) -> Tuple[str, ...]:
+    """Format labels as interned "key=value" selector strings."""
+    return tuple(sys.intern(f"{k}={v}") for k, v in labels.items())
+
+
+class _CachedModel(BaseModel):
+    """Base for component models whose derived indices are cached lazily."""
+
+    _cache_version: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any) -> None:
+        # Hold list and dict fields in tracked containers so in-place edits
+        # such as ns.pods.append(pod) also drop the cached indices.
+        values = self.__dict__
+        for name in type(self).model_fields:
+            values[name] = _tracked(values[name])
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self.__dict__[name] = _tracked(value)
+            self.invalidate_caches()
+
+    def invalidate_caches(self) -> None:
+        """Drop the cached indices of every component model."""
+        _bump_components_version()
+
+    def _sync_caches(self) -> None:
+        # Reset this model's caches if any component changed since they were built
+        if self._cache_version != _components_version:
+            for name in self.__private_attributes__:
+                if name != "_cache_version":
+                    setattr(self, name, None)
+            self._cache_version = _components_version
+
+
+# Leaf components are plain slotted dataclasses: large clusters create tens of
+# thousands of them and they need no model behaviour of their own. Pydantic
+# still validates and serializes them as fields of the models below.
+@dataclass(slots=True)
+class Container:
     name: str
     disabled: bool = False
 
 
-class OwnerReference(BaseModel):
+@dataclass(slots=True)
+class OwnerReference:
     kind: str
     name: str
 
 
-class Pod(BaseModel):
+class Pod(_CachedModel):
     name: str
     labels: Dict[str, str] = {}
     containers: List[Container] = []
     owner: Optional[OwnerReference] = None
     disabled: bool = False
 
+    _label_keys: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    _label_selectors: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    _container_names: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+
+    @field_validator("labels", mode="after")
+    @classmethod
+    def intern_labels(cls, value: Dict[str, str]) -> Dict[str, str]:
+        return _intern_labels(value)
+
+    @property
+    def label_keys(self) -> Tuple[str, ...]:
+        """The pod's label keys, in insertion order."""
+        self._sync_caches()
+        if self._label_keys is None:
+            self._label_keys = tuple(self.labels)
+        return self._label_keys
+
+    @property
+    def label_selectors(self) -> Tuple[str, ...]:
+        """The pod's labels as "key=value" selectors, in insertion order."""
+        self._sync_caches()
+        if self._label_selectors is None:
+            self._label_selectors = _label_selectors(self.labels)
+        return self._label_selectors
+
+    @property
+    def container_names(self) -> Tuple[str, ...]:
+        """Names of the pod's containers, in declaration order."""
+        self._sync_caches()
+        if self._container_names is None:
+            self._container_names = tuple(c.name for c in self.containers)
+        return self._container_names
 
-class PVC(BaseModel):
+
+class PVC(_CachedModel):
     name: str
     labels: Dict[str, str] = {}
     current_usage_percentage: Optional[float] = None
     disabled: bool = False
 
+    @field_validator("labels", mode="after")
+    @classmethod
+    def intern_labels(cls, value: Dict[str, str]) -> Dict[str, str]:
+        return _intern_labels(value)
+
 
-class ServicePort(BaseModel):
+@dataclass(slots=True)
+class ServicePort:
     port: int
     target_port: Optional[Union[int, str]] = None
     protocol: str = "TCP"
 
 
-class Service(BaseModel):
+class Service(_CachedModel):
     name: str
     labels: Dict[str, str] = {}
     ports: List[ServicePort] = []
     disabled: bool = False
 
+    _port_numbers: Optional[Tuple[int, ...]] = PrivateAttr(default=None)
+
+    @field_validator("labels", mode="after")
+    @classmethod
+    def intern_labels(cls, value: Dict[str, str]) -> Dict[str, str]:
+        return _intern_labels(value)
+
+    @property
+    def port_numbers(self) -> Tuple[int, ...]:
+        """Non-zero port numbers exposed by the service."""
+        self._sync_caches()
+        if self._port_numbers is None:
+            self._port_numbers = tuple(p.port for p in self.ports if p.port)
+        return self._port_numbers
 
-class VMI(BaseModel):
+
+class VMI(_CachedModel):
     name: str
     disabled: bool = False
 
 
-class Namespace(BaseModel):
+class Namespace(_CachedModel):
     name: str
     pods: List[Pod] = []
     services: List[Service] = []
@@ -53,8 +229,34 @@ class Namespace(BaseModel):
     vmis: List[VMI] = []
     disabled: bool = False
 
+    _services_with_ports: Optional[Tuple[Service, ...]] = PrivateAttr(default=None)
+    _pod_label_selectors: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+
+    @property
+    def services_with_ports(self) -> Tuple[Service, ...]:
+        """Services in the namespace that declare at least one port."""
+        self._sync_caches()
+        if self._services_with_ports is None:
+            self._services_with_ports = tuple(s for s in self.services if s.ports)
+        return self._services_with_ports
 
-class Node(BaseModel):
+    @property
+    def pod_label_selectors(self) -> Tuple[str, ...]:
+        """
+        De-duplicated "key=value" selectors across the namespace's pods. Kept as
+        an ordered tuple rather than a set so seeded draws stay reproducible.
+        """
+        self._sync_caches()
+        if self._pod_label_selectors is None:
+            self._pod_label_selectors = tuple(
+                dict.fromkeys(
+                    selector for pod in self.pods for selector in pod.label_selectors
+                )
+            )
+        return self._pod_label_selectors
+
+
+class Node(_CachedModel):
     name: str
     labels: Dict[str, str] = {}
     free_cpu: float = 0
@@ -63,16 +265,191 @@ class Node(BaseModel):
     taints: List[str] = []
     disabled: bool = False
 
+    _taints_json: Optional[str] = PrivateAttr(default=None)
+    _label_selectors: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+
+    @field_validator("labels", mode="after")
+    @classmethod
+    def intern_labels(cls, value: Dict[str, str]) -> Dict[str, str]:
+        return _intern_labels(value)
+
+    @property
+    def taints_json(self) -> str:
+        """JSON list of the node's taints, as passed to the hog scenarios."""
+        self._sync_caches()
+        if self._taints_json is None:
+            self._taints_json = json.dumps(self.taints)
+        return self._taints_json
 
-class ClusterComponents(BaseModel):
+    @property
+    def label_selectors(self) -> Tuple[str, ...]:
+        """The node's labels as "key=value" selectors, in insertion order."""
+        self._sync_caches()
+        if self._label_selectors is None:
+            self._label_selectors = _label_selectors(self.labels)
+        return self._label_selectors
+
+
+def build_node_label_index(nodes: List[Node]) -> Dict[str, Tuple[Node, ...]]:
+    """Map each "key=value" node label to the nodes carrying it, in node order."""
+    index: Dict[str, List[Node]] = {}
+    for node in nodes:
+        for selector in node.label_selectors:
+            index.setdefault(selector, []).append(node)
+    return {label: tuple(matching) for label, matching in index.items()}
+
+
+class ClusterComponents(_CachedModel):
     namespaces: List[Namespace] = []
     nodes: List[Node] = []
 
+    # Flattened (namespace, pod) pairs, built on first use. Scenarios mutate
+    # many times over the same snapshot, so the namespace walk is done once.
+    _all_pods: Optional[Tuple[Tuple[Namespace, Pod], ...]] = PrivateAttr(default=None)
+    _labelled_pods: Optional[Tuple[Tuple[Namespace, Pod], ...]] = PrivateAttr(
+        default=None
+    )
+    _labelled_pods_with_containers: Optional[Tuple[Tuple[Namespace, Pod], ...]] = (
+        PrivateAttr(default=None)
+    )
+    _all_pvcs: Optional[Tuple[Tuple[Namespace, PVC], ...]] = PrivateAttr(default=None)
+    _all_vmis: Optional[Tuple[Tuple[Namespace, VMI], ...]] = PrivateAttr(default=None)
+    _namespaces_with_services: Optional[Tuple[Namespace, ...]] = PrivateAttr(
+        default=None
+    )
+    _namespaces_with_service_ports: Optional[Tuple[Namespace, ...]] = PrivateAttr(
+        default=None
+    )
+
+    # "key=value" node label -> nodes carrying it, built on first use.
+    _node_label_index: Optional[Dict[str, Tuple[Node, ...]]] = PrivateAttr(default=None)
+    _node_label_keys: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    _nodes_with_interfaces: Optional[Tuple[Node, ...]] = PrivateAttr(default=None)
+    _namespaces_with_pods: Optional[Tuple[Namespace, ...]] = PrivateAttr(default=None)
+    _active_components: Optional["ClusterComponents"] = PrivateAttr(default=None)
+
+    @property
+    def node_label_index(self) -> Dict[str, Tuple[Node, ...]]:
+        """Inverted "key=value" -> nodes index over the cluster snapshot."""
+        self._sync_caches()
+        if self._node_label_index is None:
+            self._node_label_index = build_node_label_index(self.nodes)
+        return self._node_label_index
+
+    @property
+    def node_label_keys(self) -> Tuple[str, ...]:
+        """Keys of node_label_index, for index-based random selection."""
+        self._sync_caches()
+        if self._node_label_keys is None:
+            self._node_label_keys = tuple(self.node_label_index)
+        return self._node_label_keys
+
+    @property
+    def all_pods(self) -> Tuple[Tuple[Namespace, Pod], ...]:
+        """(namespace, pod) pairs for every pod in the cluster snapshot."""
+        self._sync_caches()
+        if self._all_pods is None:
+            self._all_pods = tuple(
+                (ns, pod) for ns in self.namespaces for pod in ns.pods
+            )
+        return self._all_pods
+
+    @property
+    def labelled_pods(self) -> Tuple[Tuple[Namespace, Pod], ...]:
+        """(namespace, pod) pairs for pods with at least one label."""
+        self._sync_caches()
+        if self._labelled_pods is None:
+            self._labelled_pods = tuple(
+                (ns, pod) for ns, pod in self.all_pods if len(pod.labels) > 0
+            )
+        return self._labelled_pods
+
+    @property
+    def labelled_pods_with_containers(self) -> Tuple[Tuple[Namespace, Pod], ...]:
+        """(namespace, pod) pairs for labelled pods with at least one container."""
+        self._sync_caches()
+        if self._labelled_pods_with_containers is None:
+            self._labelled_pods_with_containers = tuple(
+                (ns, pod) for ns, pod in self.labelled_pods if len(pod.containers) > 0
+            )
+        return self._labelled_pods_with_containers
+
+    @property
+    def all_pvcs(self) -> Tuple[Tuple[Namespace, PVC], ...]:
+        """(namespace, pvc) pairs for every PVC in the cluster snapshot."""
+        self._sync_caches()
+        if self._all_pvcs is None:
+            self._all_pvcs = tuple(
+                (ns, pvc) for ns in self.namespaces for pvc in ns.pvcs
+            )
+        return self._all_pvcs
+
+    @property
+    def all_vmis(self) -> Tuple[Tuple[Namespace, VMI], ...]:
+        """(namespace, vmi) pairs for every VMI in the cluster snapshot."""
+        self._sync_caches()
+        if self._all_vmis is None:
+            self._all_vmis = tuple(
+                (ns, vmi) for ns in self.namespaces for vmi in ns.vmis
+            )
+        return self._all_vmis
+
+    @property
+    def namespaces_with_pods(self) -> Tuple[Namespace, ...]:
+        """Namespaces with at least one pod."""
+        self._sync_caches()
+        if self._namespaces_with_pods is None:
+            self._namespaces_with_pods = tuple(ns for ns in self.namespaces if ns.pods)
+        return self._namespaces_with_pods
+
+    @property
+    def namespaces_with_services(self) -> Tuple[Namespace, ...]:
+        """Namespaces with at least one service."""
+        self._sync_caches()
+        if self._namespaces_with_services is None:
+            self._namespaces_with_services = tuple(
+                ns for ns in self.namespaces if ns.services
+            )
+        return self._namespaces_with_services
+
+    @property
+    def namespaces_with_service_ports(self) -> Tuple[Namespace, ...]:
+        """Namespaces with at least one service exposing a port."""
+        self._sync_caches()
+        if self._namespaces_with_service_ports is None:
+            self._namespaces_with_service_ports = tuple(
+                ns for ns in self.namespaces_with_services if ns.services_with_ports
+            )
+        return self._namespaces_with_service_ports
+
+    @property
+    def nodes_with_interfaces(self) -> Tuple[Node, ...]:
+        """Nodes reporting at least one network interface."""
+        self._sync_caches()
+        if self._nodes_with_interfaces is None:
+            self._nodes_with_interfaces = tuple(n for n in self.nodes if n.interfaces)
+        return self._nodes_with_interfaces
+
+    def iter_active_nodes(self) -> Iterator[Node]:
+        """Yield nodes that are not disabled without building a new list."""
+        return (n for n in self.nodes if not n.disabled)
+
     def get_active_components(self) -> "ClusterComponents":
         """
-        Returns a new ClusterComponents instance with disabled items filtered out.
+        Returns a ClusterComponents instance with disabled items filtered out.
         This provides a centralized way to filter disabled components for all scenarios.
+
+        The filtered instance is built once and shared, so every scenario created
+        from this snapshot also shares its cached pod and node indices. It is
+        rebuilt after any component edit, including edits made through it, so
+        this snapshot stays the source of truth.
         """
+        self._sync_caches()
+        if self._active_components is None:
+            self._active_components = self._build_active_components()
+        return self._active_components
+
+    def _build_active_components(self) -> "ClusterComponents":
         active_namespaces = []
         for ns in self.namespaces:
             if ns.disabled:
@@ -88,6 +465,6 @@ class ClusterComponents(BaseModel):
             )
             active_namespaces.append(active_ns)
 
-        active_nodes = [n for n in self.nodes if not n.disabled]
+        active_nodes = list(self.iter_active_nodes())
 
         return ClusterComponents(namespaces=active_namespaces, nodes=active_nodes)
@@ -1,8 +1,18 @@
 import uuid
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, List, Optional
-
-from pydantic import BaseModel, Field, PrivateAttr
+from typing import (
+    Any,
+    ClassVar,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    TypeVar,
+    dataclass_transform,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_serializer
 
 from krkn_ai.models.cluster_components import ClusterComponents
 
@@ -15,9 +25,22 @@ class ScenarioOrigin(str, Enum):
     TYPE_MUTATION = "type_mutation"
 
 
-class BaseParameter(BaseModel):
-    krknctl_name: str = ""  # Name of parameter in krknctl
-    krknhub_name: str = ""  # Name of parameter in krknhub
+_ParameterT = TypeVar("_ParameterT")
+
+
+# Parameters are plain slotted dataclasses rather than pydantic models: every
+# scenario instantiation and GA mutation creates or copies a handful of them,
+# and they never need validation of their own.
+@dataclass_transform(kw_only_default=True, field_specifiers=(field,))
+def parameter_dataclass(cls: type[_ParameterT]) -> type[_ParameterT]:
+    """Declare a parameter class as a keyword-only slotted dataclass."""
+    return dataclass(slots=True, kw_only=True)(cls)
+
+
+@parameter_dataclass
+class BaseParameter:
+    krknctl_name: ClassVar[str] = ""  # Name of parameter in krknctl
+    krknhub_name: ClassVar[str] = ""  # Name of parameter in krknhub
 
     value: Any  # Value of parameter that is going to be passed to krknctl or krknhub
 
@@ -29,6 +52,17 @@ class BaseParameter(BaseModel):
     def get_value(self, return_krknhub_name: bool = False):
         return self.value
 
+    @model_serializer(mode="wrap")
+    def serialize(self, handler):
+        # Keep the class-level names in result files and Elasticsearch documents,
+        # and leave out underscore fields, which hold runtime state only.
+        data = handler(self)
+        return {
+            "krknctl_name": self.krknctl_name,
+            "krknhub_name": self.krknhub_name,
+            **{k: v for k, v in data.items() if not k.startswith("_")},
+        }
+
 
 class BaseScenario(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -40,13 +74,59 @@ class BaseScenario(BaseModel):
 
 
 class Scenario(BaseScenario):
+    # Most scenario classes are never instantiated in a given run, so build their
+    # validators lazily on first use instead of at import time.
+    model_config = ConfigDict(defer_build=True)
+
+    # Names of the parameter fields passed to krknctl / krknhub, in order. Scenarios
+    # whose parameter list depends on parameter values override `parameters`.
+    parameter_names: ClassVar[Tuple[str, ...]] = ()
+
     # Private attribute doesn't appear when serializing, but lets us keep referene
     _cluster_components: ClusterComponents = PrivateAttr()
+    _parameters: Optional[Tuple[BaseParameter, ...]] = PrivateAttr(default=None)
 
-    def __init__(self, **data):
+    def __init__(self, mutate_on_init: bool = True, **data):
         cluster_components = data.pop("cluster_components")
         super().__init__(**data)
         self._cluster_components = cluster_components
+        # Callers that only inspect the scenario's shape (e.g. its parameter types)
+        # can skip drawing parameter values they would throw away.
+        if mutate_on_init:
+            self.mutate()
+
+    @classmethod
+    def construct_trusted(
+        cls,
+        cluster_components: ClusterComponents,
+        mutate_on_init: bool = True,
+        **data,
+    ) -> Self:
+        """
+        Build a scenario from trusted data without running pydantic validation.
+
+        For the factory and the GA, which create many scenarios from class
+        defaults. Anything built from external input should go through __init__.
+        """
+        scenario = cls.model_construct(**data)
+        scenario._cluster_components = cluster_components
+        if mutate_on_init:
+            scenario.mutate()
+        return scenario
+
+    def mutate(self) -> None:
+        """Draw new parameter values from the cluster components."""
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.parameter_names:
+            self._parameters = None
+
+    @property
+    def parameters(self) -> Tuple[BaseParameter, ...]:
+        if self._parameters is None:
+            self._parameters = tuple(getattr(self, n) for n in self.parameter_names)
+        return self._parameters
 
     def scenario_wait_duration(self, config_wait_duration: int) -> int:
         return config_wait_duration
@@ -1,5 +1,6 @@
 import contextlib
 import logging
+from operator import attrgetter
 from typing import Dict, List, Tuple
 from krkn_ai.models.cluster_components import ClusterComponents
 from krkn_ai.models.config import ConfigFile, FitnessFunction, ScenarioConfig
@@ -45,7 +46,7 @@ def _suppressed_factory_warnings():
         logger.setLevel(previous)
 
 
-scenario_specs = [
+scenario_specs = (
     ("pod_scenarios", PodScenario),
     ("application_outages", AppOutageScenario),
     ("container_scenarios", ContainerScenario),
@@ -60,7 +61,12 @@ scenario_specs = [
     ("kubevirt_scenarios", KubevirtDisruptionScenario),
     ("storage_throttle", StorageThrottleScenario),
     ("service_disruption", ServiceDisruptionScenario),
-]
+)
+
+# (attr, scenario class, bound getter for the scenario config section)
+_scenario_config_getters = tuple(
+    (attr, cls, attrgetter(attr)) for attr, cls in scenario_specs
+)
 
 # Scenarios with a cluster-critical blast radius (e.g. namespace deletion).
 # Gated behind ``allow_dangerous_scenarios`` — their own ``enable`` flag is
@@ -72,8 +78,8 @@ class ScenarioFactory:
     @staticmethod
     def list_scenarios(config: ConfigFile) -> List[Tuple[str, type[Scenario]]]:
         candidates = []
-        for attr, factory in scenario_specs:
-            scenario_cfg = getattr(config.scenario, attr)
+        for attr, factory, get_scenario_cfg in _scenario_config_getters:
+            scenario_cfg = get_scenario_cfg(config.scenario)
             if scenario_cfg is None or not scenario_cfg.enable:
                 continue
             if attr in DANGEROUS_SCENARIOS and not config.allow_dangerous_scenarios:
@@ -114,7 +120,7 @@ class ScenarioFactory:
         for name, cls in candidates:
             try:
                 # Try to instantiate the scenario with active components only
-                cls(cluster_components=active_components)
+                cls.construct_trusted(cluster_components=active_components)
                 valid_scenarios.append((name, cls))
             except ScenarioParameterInitError as error:
                 logger.warning(
@@ -150,7 +156,7 @@ class ScenarioFactory:
             active_components = config.cluster_components.get_active_components()
             # Unpack Scenario class and create instance
             _, cls = rng.choice(candidates)
-            return cls(cluster_components=active_components)
+            return cls.construct_trusted(cluster_components=active_components)
         except Exception as error:
             raise ScenarioInitError("Unable to initialize scenario: %s" % error)
 
@@ -1,169 +1,204 @@
 import math
-from typing import Optional
-from pydantic import BaseModel, Field, PrivateAttr
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
 from krkn_ai.utils.rng import rng
-from krkn_ai.models.scenario.base import BaseParameter
+from krkn_ai.models.scenario.base import BaseParameter, parameter_dataclass
 
 
+# Percentage parameters step up by 1-35% or down by 1-25% of their current value,
+# each with probability 1/2. A single draw in [0, 2 * 35 * 25) covers both: its
+# lower half maps uniformly onto the 35 up-steps and its upper half onto the 25
+# down-steps.
+_PERCENT_STEP_UP = 35
+_PERCENT_STEP_DOWN = 25
+_PERCENT_STEP_SPAN = _PERCENT_STEP_UP * _PERCENT_STEP_DOWN
+
+_OBJECT_TYPES = ("pod", "node")
+_TIME_ACTIONS = ("skew_date", "skew_time")
+_TRAFFIC_TYPES = ("ingress", "egress")
+_EXECUTION_MODES = ("serial", "parallel")
+_THROTTLE_TYPES = ("iops", "bandwidth", "both")
+
+
+def _mutate_percentage(value: int, lower: int, upper: int = 100) -> int:
+    """Randomly step a percentage value up or down and clamp it to [lower, upper]."""
+    draw = rng.randint(0, 2 * _PERCENT_STEP_SPAN - 1)
+    if draw < _PERCENT_STEP_SPAN:
+        step = 1 + draw % _PERCENT_STEP_UP
+    else:
+        step = -(1 + draw % _PERCENT_STEP_DOWN)
+    return min(max(int(value + step * value / 100), lower), upper)
+
+
+@parameter_dataclass
 class DummyEndParameter(BaseParameter):
-    krknhub_name: str = "END"
-    krknctl_name: str = "duration"
+    krknhub_name: ClassVar[str] = "END"
+    krknctl_name: ClassVar[str] = "duration"
     value: int = 10
 
 
+@parameter_dataclass
 class DummyExitStatusParameter(BaseParameter):
-    krknhub_name: str = "EXIT_STATUS"
-    krknctl_name: str = "exit-status"
+    krknhub_name: ClassVar[str] = "EXIT_STATUS"
+    krknctl_name: ClassVar[str] = "exit-status"
     value: int = 0
 
 
+@parameter_dataclass
 class NamespaceParameter(BaseParameter):
-    krknhub_name: str = "NAMESPACE"
-    krknctl_name: str = "namespace"
+    krknhub_name: ClassVar[str] = "NAMESPACE"
+    krknctl_name: ClassVar[str] = "namespace"
     value: str = ""
 
 
+@parameter_dataclass
 class PodLabelParameter(BaseParameter):
-    krknhub_name: str = "POD_LABEL"
-    krknctl_name: str = "pod-label"
+    krknhub_name: ClassVar[str] = "POD_LABEL"
+    krknctl_name: ClassVar[str] = "pod-label"
     value: str = ""  # Example: service=payment
 
 
+@parameter_dataclass
 class NamePatternParameter(BaseParameter):
-    krknhub_name: str = "NAME_PATTERN"
-    krknctl_name: str = "name-pattern"
+    krknhub_name: ClassVar[str] = "NAME_PATTERN"
+    krknctl_name: ClassVar[str] = "name-pattern"
     value: str = ".*"
 
 
+@parameter_dataclass
 class DisruptionCountParameter(BaseParameter):
-    krknhub_name: str = "DISRUPTION_COUNT"
-    krknctl_name: str = "disruption-count"
+    krknhub_name: ClassVar[str] = "DISRUPTION_COUNT"
+    krknctl_name: ClassVar[str] = "disruption-count"
     value: int = 1
 
 
+@parameter_dataclass
 class DeleteCountParameter(BaseParameter):
-    krknhub_name: str = "DELETE_COUNT"
-    krknctl_name: str = "delete-count"
+    krknhub_name: ClassVar[str] = "DELETE_COUNT"
+    krknctl_name: ClassVar[str] = "delete-count"
     value: int = 1
 
 
+@parameter_dataclass
 class RunsParameter(BaseParameter):
-    krknhub_name: str = "RUNS"
-    krknctl_name: str = "runs"
+    krknhub_name: ClassVar[str] = "RUNS"
+    krknctl_name: ClassVar[str] = "runs"
     value: int = 1
 
 
+@parameter_dataclass
 class KillTimeoutParameter(BaseParameter):
-    krknhub_name: str = "KILL_TIMEOUT"
-    krknctl_name: str = "kill-timeout"
+    krknhub_name: ClassVar[str] = "KILL_TIMEOUT"
+    krknctl_name: ClassVar[str] = "kill-timeout"
     value: int = 60
 
 
+@parameter_dataclass
 class ExpRecoveryTimeParameter(BaseParameter):
-    krknhub_name: str = "EXPECTED_RECOVERY_TIME"
-    krknctl_name: str = "expected-recovery-time"
+    krknhub_name: ClassVar[str] = "EXPECTED_RECOVERY_TIME"
+    krknctl_name: ClassVar[str] = "expected-recovery-time"
     value: int = 60
 
 
+@parameter_dataclass
 class DurationParameter(BaseParameter):
-    krknhub_name: str = "DURATION"
-    krknctl_name: str = "chaos-duration"
+    krknhub_name: ClassVar[str] = "DURATION"
+    krknctl_name: ClassVar[str] = "chaos-duration"
     value: int = 60
 
 
+@parameter_dataclass
 class PodSelectorParameter(BaseParameter):
-    krknhub_name: str = "POD_SELECTOR"
-    krknctl_name: str = "pod-selector"
+    krknhub_name: ClassVar[str] = "POD_SELECTOR"
+    krknctl_name: ClassVar[str] = "pod-selector"
     value: str = ""  # Format: {app: foo}
 
 
+@parameter_dataclass
 class BlockTrafficType(BaseParameter):
-    krknhub_name: str = "BLOCK_TRAFFIC_TYPE"
-    krknctl_name: str = "block-traffic-type"
+    krknhub_name: ClassVar[str] = "BLOCK_TRAFFIC_TYPE"
+    krknctl_name: ClassVar[str] = "block-traffic-type"
     value: str = "[Ingress, Egress]"  # "[Ingress, Egress]", "[Ingress]", "[Egress]"
 
 
+@parameter_dataclass
 class LabelSelectorParameter(BaseParameter):
-    krknhub_name: str = "LABEL_SELECTOR"
-    krknctl_name: str = "label-selector"
+    krknhub_name: ClassVar[str] = "LABEL_SELECTOR"
+    krknctl_name: ClassVar[str] = "label-selector"
     value: str = ""  # Example Value: k8s-app=etcd
 
 
+@parameter_dataclass
 class ContainerNameParameter(BaseParameter):
-    krknhub_name: str = "CONTAINER_NAME"
-    krknctl_name: str = "container-name"
+    krknhub_name: ClassVar[str] = "CONTAINER_NAME"
+    krknctl_name: ClassVar[str] = "container-name"
     value: str = ""  # Example Value: etcd
 
 
+@parameter_dataclass
 class ActionParameter(BaseParameter):
-    krknhub_name: str = "ACTION"
-    krknctl_name: str = "action"
+    krknhub_name: ClassVar[str] = "ACTION"
+    krknctl_name: ClassVar[str] = "action"
     value: str = "1"
     # possible_values = ["1", "9"]
 
 
+@parameter_dataclass
 class TotalChaosDurationParameter(BaseParameter):
-    krknhub_name: str = "TOTAL_CHAOS_DURATION"
-    krknctl_name: str = "chaos-duration"
+    krknhub_name: ClassVar[str] = "TOTAL_CHAOS_DURATION"
+    krknctl_name: ClassVar[str] = "chaos-duration"
     value: int = 60
 
 
+@parameter_dataclass
 class NodeCPUCoreParameter(BaseParameter):
-    krknhub_name: str = "NODE_CPU_CORE"
-    krknctl_name: str = "cores"
+    krknhub_name: ClassVar[str] = "NODE_CPU_CORE"
+    krknctl_name: ClassVar[str] = "cores"
     value: float = 2
 
 
+@parameter_dataclass
 class NodeCPUPercentageParameter(BaseParameter):
     """
     CPU usage percentage of the node cpu hog scenario between 20 and 100.
     """
 
-    krknhub_name: str = "NODE_CPU_PERCENTAGE"
-    krknctl_name: str = "cpu-percentage"
+    krknhub_name: ClassVar[str] = "NODE_CPU_PERCENTAGE"
+    krknctl_name: ClassVar[str] = "cpu-percentage"
     value: int = 50
 
     def mutate(self):
-        if rng.random() < 0.5:
-            self.value += rng.randint(1, 35) * self.value / 100
-        else:
-            self.value -= rng.randint(1, 25) * self.value / 100
-        self.value = int(self.value)
-        self.value = max(self.value, 20)
-        self.value = min(self.value, 100)
+        self.value = _mutate_percentage(self.value, lower=20)
 
 
+@parameter_dataclass
 class NodeMemoryPercentageParameter(BaseParameter):
     """
     Memory usage percentage of the node memory hog scenario between 20 and 100.
     """
 
-    krknhub_name: str = "MEMORY_CONSUMPTION_PERCENTAGE"
-    krknctl_name: str = "memory-consumption"
+    krknhub_name: ClassVar[str] = "MEMORY_CONSUMPTION_PERCENTAGE"
+    krknctl_name: ClassVar[str] = "memory-consumption"
     value: int = 50
 
     def get_value(self, return_krknhub_name: bool = False):
         return f"{self.value}%"
 
     def mutate(self):
-        if rng.random() < 0.5:
-            self.value += rng.randint(1, 35) * self.value / 100
-        else:
-            self.value -= rng.randint(1, 25) * self.value / 100
-        self.value = int(self.value)
-        self.value = max(self.value, 20)
-        self.value = min(self.value, 100)
+        self.value = _mutate_percentage(self.value, lower=20)
 
 
+@parameter_dataclass
 class NumberOfWorkersParameter(BaseParameter):
-    krknhub_name: str = "NUMBER_OF_WORKERS"
-    krknctl_name: str = "memory-workers"
+    krknhub_name: ClassVar[str] = "NUMBER_OF_WORKERS"
+    krknctl_name: ClassVar[str] = "memory-workers"
     value: int = 1
 
     def mutate(self):
         self.value = rng.randint(1, 10)
 
 
+@parameter_dataclass
 class NodeSelectorParameter(BaseParameter):
     """
     CPU-Hog:
@@ -175,176 +210,196 @@ class NodeSelectorParameter(BaseParameter):
     defines the node selector for choosing target nodes. If not specified, one schedulable node in the cluster will be chosen at random. If multiple nodes match the selector, all of them will be subjected to stress. If number-of-nodes is specified, that many nodes will be randomly selected from those identified by the selector.
     """
 
-    krknhub_name: str = "NODE_SELECTOR"
-    krknctl_name: str = "node-selector"
+    krknhub_name: ClassVar[str] = "NODE_SELECTOR"
+    krknctl_name: ClassVar[str] = "node-selector"
     value: str = ""
 
 
+@parameter_dataclass
 class TaintParameter(BaseParameter):
-    krknhub_name: str = "TAINTS"
-    krknctl_name: str = "taints"
+    krknhub_name: ClassVar[str] = "TAINTS"
+    krknctl_name: ClassVar[str] = "taints"
     value: str = "[]"
 
 
+@parameter_dataclass
 class NumberOfNodesParameter(BaseParameter):
-    krknhub_name: str = "NUMBER_OF_NODES"
-    krknctl_name: str = "number-of-nodes"
+    krknhub_name: ClassVar[str] = "NUMBER_OF_NODES"
+    krknctl_name: ClassVar[str] = "number-of-nodes"
     value: int = 1
 
 
+@parameter_dataclass
 class HogScenarioImageParameter(BaseParameter):
-    krknhub_name: str = "IMAGE"
-    krknctl_name: str = "image"
+    krknhub_name: ClassVar[str] = "IMAGE"
+    krknctl_name: ClassVar[str] = "image"
     value: str = "quay.io/krkn-chaos/krkn-hog"
 
 
+@parameter_dataclass
 class ObjectTypeParameter(BaseParameter):
-    krknhub_name: str = "OBJECT_TYPE"
-    krknctl_name: str = "object-type"
+    krknhub_name: ClassVar[str] = "OBJECT_TYPE"
+    krknctl_name: ClassVar[str] = "object-type"
     value: str = ""  # Available Types: pod, node
 
     def mutate(self):
-        self.value = rng.choice(["pod", "node"])
+        self.value = rng.pick(_OBJECT_TYPES)
 
 
+@parameter_dataclass
 class ActionTimeParameter(BaseParameter):
-    krknhub_name: str = "ACTION"
-    krknctl_name: str = "action"
+    krknhub_name: ClassVar[str] = "ACTION"
+    krknctl_name: ClassVar[str] = "action"
     value: str = "skew_date"  # Available Types: skew_date, skew_time
 
     def mutate(self):
-        self.value = rng.choice(["skew_date", "skew_time"])
+        self.value = rng.pick(_TIME_ACTIONS)
 
 
+@parameter_dataclass
 class NetworkScenarioTypeParameter(BaseParameter):
-    krknhub_name: str = "TRAFFIC_TYPE"
-    krknctl_name: str = "traffic-type"
+    krknhub_name: ClassVar[str] = "TRAFFIC_TYPE"
+    krknctl_name: ClassVar[str] = "traffic-type"
     value: str = "ingress"
 
     def mutate(self):
-        self.value = rng.choice(["ingress", "egress"])
+        self.value = rng.pick(_TRAFFIC_TYPES)
 
 
+@parameter_dataclass
 class NetworkScenarioImageParameter(BaseParameter):
-    krknhub_name: str = "IMAGE"
-    krknctl_name: str = "image"
+    krknhub_name: ClassVar[str] = "IMAGE"
+    krknctl_name: ClassVar[str] = "image"
     value: str = "quay.io/krkn-chaos/krkn:tools"
 
 
+@parameter_dataclass
 class StandardDurationParameter(BaseParameter):
     """
     Standard duration parameter with krknctl_name="duration" and krknhub_name="DURATION".
     """
 
-    krknhub_name: str = "DURATION"
-    krknctl_name: str = "duration"
+    krknhub_name: ClassVar[str] = "DURATION"
+    krknctl_name: ClassVar[str] = "duration"
     value: int = 120
 
 
+@parameter_dataclass
 class NetworkScenarioLabelSelectorParameter(BaseParameter):
-    krknhub_name: str = "LABEL_SELECTOR"
-    krknctl_name: str = "label-selector"
+    krknhub_name: ClassVar[str] = "LABEL_SELECTOR"
+    krknctl_name: ClassVar[str] = "label-selector"
     value: str = ""
 
 
+@parameter_dataclass
 class NetworkScenarioExecutionParameter(BaseParameter):
-    krknhub_name: str = "EXECUTION"
-    krknctl_name: str = "execution"
+    krknhub_name: ClassVar[str] = "EXECUTION"
+    krknctl_name: ClassVar[str] = "execution"
     value: str = "parallel"
 
     def mutate(self):
-        self.value = rng.choice(["serial", "parallel"])
+        self.value = rng.pick(_EXECUTION_MODES)
 
 
+@parameter_dataclass
 class NetworkScenarioNodeNameParameter(BaseParameter):
-    krknhub_name: str = "NODE_NAME"
-    krknctl_name: str = "node-name"
+    krknhub_name: ClassVar[str] = "NODE_NAME"
+    krknctl_name: ClassVar[str] = "node-name"
     value: str = ""
 
 
+@parameter_dataclass
 class NetworkScenarioInterfacesParameter(BaseParameter):
     # TODO: Understand the format and values of the interfaces parameter
-    krknhub_name: str = "INTERFACES"
-    krknctl_name: str = "interfaces"
+    krknhub_name: ClassVar[str] = "INTERFACES"
+    krknctl_name: ClassVar[str] = "interfaces"
     value: str = "[]"
 
 
-class NetworkParamData(BaseModel):
+@dataclass(slots=True)
+class NetworkParamData:
     latency: int = 50  # ms
     loss: float = 0.02  # %
     bandwidth: int = 100  # mbit
 
+    def mutate(self, include_loss: bool = False):
+        self.latency = rng.randint(1, 1000)
+        if include_loss:
+            self.loss = round(rng.uniform(0.01, 0.1), 2)
+        self.bandwidth = rng.randint(100, 1000)
 
+
+@parameter_dataclass
 class NetworkScenarioNetworkParamsParameter(BaseParameter):
-    krknhub_name: str = "NETWORK_PARAMS"
-    krknctl_name: str = "network-params"
-    value: NetworkParamData = Field(default_factory=NetworkParamData)
+    krknhub_name: ClassVar[str] = "NETWORK_PARAMS"
+    krknctl_name: ClassVar[str] = "network-params"
+    value: NetworkParamData = field(default_factory=NetworkParamData)
 
     def mutate(self):
-        self.value.latency = rng.randint(1, 1000)
-        self.value.bandwidth = rng.randint(100, 1000)
+        self.value.mutate()
 
     def get_value(self, return_krknhub_name: bool = False):
         # TODO: Add support for loss once https://github.com/krkn-chaos/krkn-hub/pull/349 is merged
         # loss is excluded: krknctl regex requires unquoted numeric values which
         # YAML parses as float, but krkn's arcaflow model requires Dict[str, str]
-        return (
-            "{"
-            + f"latency: {self.value.latency}ms,bandwidth: {self.value.bandwidth}mbit"
-            + "}"
-        )
+        value = self.value
+        return f"{{latency: {value.latency}ms,bandwidth: {value.bandwidth}mbit}}"
 
 
+@parameter_dataclass
 class NetworkScenarioEgressParamsParameter(BaseParameter):
-    krknhub_name: str = "EGRESS"
-    krknctl_name: str = "egress"
-    value: NetworkParamData = Field(default_factory=NetworkParamData)
+    krknhub_name: ClassVar[str] = "EGRESS"
+    krknctl_name: ClassVar[str] = "egress"
+    value: NetworkParamData = field(default_factory=NetworkParamData)
 
     def mutate(self):
-        self.value.latency = rng.randint(1, 1000)
-        self.value.loss = round(rng.uniform(0.01, 0.1), 2)
-        self.value.bandwidth = rng.randint(100, 1000)
+        self.value.mutate(include_loss=True)
 
     def get_value(self, return_krknhub_name: bool = False):
+        value = self.value
         return (
-            "{"
-            + f"latency: {self.value.latency}ms,loss: {self.value.loss},bandwidth: {self.value.bandwidth}mbit"
-            + "}"
+            f"{{latency: {value.latency}ms,loss: {value.loss},"
+            f"bandwidth: {value.bandwidth}mbit}}"
         )
 
 
+@parameter_dataclass
 class NetworkScenarioTargetNodeInterfaceParameter(BaseParameter):
     # TODO: Understand the format and values of the target-node-interface parameter
-    krknhub_name: str = "TARGET_NODE_AND_INTERFACE"
-    krknctl_name: str = "target-node-interface"
+    krknhub_name: ClassVar[str] = "TARGET_NODE_AND_INTERFACE"
+    krknctl_name: ClassVar[str] = "target-node-interface"
     value: str = "{}"
 
 
+@parameter_dataclass
 class DNSOutageDurationParameter(BaseParameter):
-    krknhub_name: str = "TEST_DURATION"
-    krknctl_name: str = "chaos-duration"
+    krknhub_name: ClassVar[str] = "TEST_DURATION"
+    krknctl_name: ClassVar[str] = "chaos-duration"
     value: int = 60
 
 
+@parameter_dataclass
 class DNSOutageProtocolParameter(BaseParameter):
-    krknhub_name: str = "PROTOCOLS"
-    krknctl_name: str = "protocols"
+    krknhub_name: ClassVar[str] = "PROTOCOLS"
+    krknctl_name: ClassVar[str] = "protocols"
     value: str = "tcp,udp"
 
 
+@parameter_dataclass
 class DNSPortParameter(BaseParameter):
-    krknhub_name: str = "PORTS"
-    krknctl_name: str = "ports"
+    krknhub_name: ClassVar[str] = "PORTS"
+    krknctl_name: ClassVar[str] = "ports"
     value: str = ""
 
 
+@parameter_dataclass
 class PodNameParameter(BaseParameter):
-    krknhub_name: str = "POD_NAME"
-    krknctl_name: str = "pod-name"
+    krknhub_name: ClassVar[str] = "POD_NAME"
+    krknctl_name: ClassVar[str] = "pod-name"
     value: str = ""
-    _namespace: str = PrivateAttr(default="")
-    _owner_kind: Optional[str] = PrivateAttr(default=None)
-    _owner_name: Optional[str] = PrivateAttr(default=None)
+    _namespace: str = field(default="", init=False, repr=False)
+    _owner_kind: Optional[str] = field(default=None, init=False, repr=False)
+    _owner_name: Optional[str] = field(default=None, init=False, repr=False)
 
     def set_pod(self, namespace, pod):
         """Store pod identity for lazy resolution at execution time."""
@@ -367,28 +422,32 @@ class PodNameParameter(BaseParameter):
         return self.value
 
 
+@parameter_dataclass
 class IngressParameter(BaseParameter):
-    krknhub_name: str = "INGRESS"
-    krknctl_name: str = "ingress"
+    krknhub_name: ClassVar[str] = "INGRESS"
+    krknctl_name: ClassVar[str] = "ingress"
     value: str = "false"
 
 
+@parameter_dataclass
 class EgressParameter(BaseParameter):
-    krknhub_name: str = "EGRESS"
-    krknctl_name: str = "egress"
+    krknhub_name: ClassVar[str] = "EGRESS"
+    krknctl_name: ClassVar[str] = "egress"
     value: str = "true"
 
 
 # PVC Scenario Parameters
+@parameter_dataclass
 class PVCNameParameter(BaseParameter):
-    krknhub_name: str = "PVC_NAME"
-    krknctl_name: str = "pvc-name"
+    krknhub_name: ClassVar[str] = "PVC_NAME"
+    krknctl_name: ClassVar[str] = "pvc-name"
     value: str = ""
 
 
+@parameter_dataclass
 class FillPercentageParameter(BaseParameter):
-    krknhub_name: str = "FILL_PERCENTAGE"
-    krknctl_name: str = "fill-percentage"
+    krknhub_name: ClassVar[str] = "FILL_PERCENTAGE"
+    krknctl_name: ClassVar[str] = "fill-percentage"
     value: int = 50
 
     def mutate(self, min_value: float = None):
@@ -407,61 +466,70 @@ class FillPercentageParameter(BaseParameter):
 
 
 # SYN Flood Scenario Parameters
+@parameter_dataclass
 class SynFloodPacketSizeParameter(BaseParameter):
-    krknhub_name: str = "PACKET_SIZE"
-    krknctl_name: str = "packet-size"
+    krknhub_name: ClassVar[str] = "PACKET_SIZE"
+    krknctl_name: ClassVar[str] = "packet-size"
     value: int = 120
 
 
+@parameter_dataclass
 class SynFloodWindowSizeParameter(BaseParameter):
-    krknhub_name: str = "WINDOW_SIZE"
-    krknctl_name: str = "window-size"
+    krknhub_name: ClassVar[str] = "WINDOW_SIZE"
+    krknctl_name: ClassVar[str] = "window-size"
     value: int = 64
 
 
+@parameter_dataclass
 class SynFloodTargetServiceParameter(BaseParameter):
-    krknhub_name: str = "TARGET_SERVICE"
-    krknctl_name: str = "target-service"
+    krknhub_name: ClassVar[str] = "TARGET_SERVICE"
+    krknctl_name: ClassVar[str] = "target-service"
     value: str = ""
 
 
+@parameter_dataclass
 class SynFloodTargetPortParameter(BaseParameter):
-    krknhub_name: str = "TARGET_PORT"
-    krknctl_name: str = "target-port"
+    krknhub_name: ClassVar[str] = "TARGET_PORT"
+    krknctl_name: ClassVar[str] = "target-port"
     value: int = 80
 
 
+@parameter_dataclass
 class SynFloodTargetServiceLabelParameter(BaseParameter):
-    krknhub_name: str = "TARGET_SERVICE_LABEL"
-    krknctl_name: str = "target-service-label"
+    krknhub_name: ClassVar[str] = "TARGET_SERVICE_LABEL"
+    krknctl_name: ClassVar[str] = "target-service-label"
     value: str = ""
 
 
+@parameter_dataclass
 class SynFloodNumberOfPodsParameter(BaseParameter):
-    krknhub_name: str = "NUMBER_OF_PODS"
-    krknctl_name: str = "number-of-pods"
+    krknhub_name: ClassVar[str] = "NUMBER_OF_PODS"
+    krknctl_name: ClassVar[str] = "number-of-pods"
     value: int = 2
 
 
+@parameter_dataclass
 class SynFloodImageParameter(BaseParameter):
-    krknhub_name: str = "IMAGE"
-    krknctl_name: str = "image"
+    krknhub_name: ClassVar[str] = "IMAGE"
+    krknctl_name: ClassVar[str] = "image"
     value: str = "quay.io/krkn-chaos/krkn-syn-flood:latest"
 
 
+@parameter_dataclass
 class SynFloodNodeSelectorsParameter(BaseParameter):
-    krknhub_name: str = "NODE_SELECTORS"
-    krknctl_name: str = "node-selectors"
+    krknhub_name: ClassVar[str] = "NODE_SELECTORS"
+    krknctl_name: ClassVar[str] = "node-selectors"
     value: str = ""
 
 
+@parameter_dataclass
 class IOBlockSizeParameter(BaseParameter):
     """
     Size of each write in bytes. Size can be from 1 byte to 4 Megabytes (allowed suffix are b,k,m)
     """
 
-    krknhub_name: str = "IO_BLOCK_SIZE"
-    krknctl_name: str = "io-block-size"
+    krknhub_name: ClassVar[str] = "IO_BLOCK_SIZE"
+    krknctl_name: ClassVar[str] = "io-block-size"
     value: int = 1048576  # 1MB in bytes (1024 * 1024)
 
     def get_value(self, return_krknhub_name: bool = False):
@@ -469,12 +537,13 @@ class IOBlockSizeParameter(BaseParameter):
         Format the value with appropriate unit suffix (b, k, m).
         Returns string like "1m", "512k", "1024b"
         """
-        if self.value < 1024:
-            return f"{self.value}b"
-        elif self.value < 1024 * 1024:
-            return f"{self.value // 1024}k"
+        value = self.value
+        if value < 1 << 10:
+            return f"{value}b"
+        elif value < 1 << 20:
+            return f"{value >> 10}k"
         else:
-            return f"{self.value // (1024 * 1024)}m"
+            return f"{value >> 20}m"
 
     def mutate(self):
         """
@@ -485,27 +554,29 @@ class IOBlockSizeParameter(BaseParameter):
         self.value = rng.randint(1, max_bytes)
 
 
+@parameter_dataclass
 class IOWorkersParameter(BaseParameter):
     """
     Number of stressor instances
     """
 
-    krknhub_name: str = "IO_WORKERS"
-    krknctl_name: str = "io-workers"
+    krknhub_name: ClassVar[str] = "IO_WORKERS"
+    krknctl_name: ClassVar[str] = "io-workers"
     value: int = 5
 
     def mutate(self):
         self.value = rng.randint(1, 10)
 
 
+@parameter_dataclass
 class IOWriteBytesParameter(BaseParameter):
     """
     writes N bytes for each hdd process. The size can be expressed as % of free space on the file system
     or in units of Bytes, KBytes, MBytes and GBytes using the suffix b, k, m or g
     """
 
-    krknhub_name: str = "IO_WRITE_BYTES"
-    krknctl_name: str = "io-write-bytes"
+    krknhub_name: ClassVar[str] = "IO_WRITE_BYTES"
+    krknctl_name: ClassVar[str] = "io-write-bytes"
     value: int = 10  # Percentage of free space (1-100)
 
     def get_value(self, return_krknhub_name: bool = False):
@@ -515,75 +586,77 @@ class IOWriteBytesParameter(BaseParameter):
         """
         Mutate the percentage value between 1 and 100.
         """
-        if rng.random() < 0.5:
-            self.value += rng.randint(1, 35) * self.value / 100
-        else:
-            self.value -= rng.randint(1, 25) * self.value / 100
-        self.value = int(self.value)
-        self.value = max(self.value, 1)
-        self.value = min(self.value, 100)
+        self.value = _mutate_percentage(self.value, lower=1)
 
 
+@parameter_dataclass
 class NodeMountPathParameter(BaseParameter):
     """
     the path in the node that will be mounted in the pod and where the io hog will be executed.
     NOTE: be sure that kubelet has the rights to write in that node path
     """
 
-    krknhub_name: str = "NODE_MOUNT_PATH"
-    krknctl_name: str = "node-mount-path"
+    krknhub_name: ClassVar[str] = "NODE_MOUNT_PATH"
+    krknctl_name: ClassVar[str] = "node-mount-path"
     value: str = "/root"
 
 
+@parameter_dataclass
 class VMTimeoutParameter(BaseParameter):
-    krknhub_name: str = "TIMEOUT"
-    krknctl_name: str = "timeout"
+    krknhub_name: ClassVar[str] = "TIMEOUT"
+    krknctl_name: ClassVar[str] = "timeout"
     value: int = 60
 
 
+@parameter_dataclass
 class VMNameParameter(BaseParameter):
-    krknhub_name: str = "VM_NAME"
-    krknctl_name: str = "vm-name"
+    krknhub_name: ClassVar[str] = "VM_NAME"
+    krknctl_name: ClassVar[str] = "vm-name"
     value: str = ""
 
 
+@parameter_dataclass
 class KillCountParameter(BaseParameter):
-    krknhub_name: str = "KILL_COUNT"
-    krknctl_name: str = "kill-count"
+    krknhub_name: ClassVar[str] = "KILL_COUNT"
+    krknctl_name: ClassVar[str] = "kill-count"
     value: int = 1
 
 
 # Storage Throttle Scenario Parameters
+@parameter_dataclass
 class StorageThrottleTypeParameter(BaseParameter):
-    krknhub_name: str = "THROTTLE_TYPE"
-    krknctl_name: str = "throttle-type"
+    krknhub_name: ClassVar[str] = "THROTTLE_TYPE"
+    krknctl_name: ClassVar[str] = "throttle-type"
     value: str = "bandwidth"
 
     def mutate(self):
-        self.value = rng.choice(["iops", "bandwidth", "both"])
+        self.value = rng.pick(_THROTTLE_TYPES)
 
 
+@parameter_dataclass
 class ReadIOPSParameter(BaseParameter):
-    krknhub_name: str = "READ_IOPS"
-    krknctl_name: str = "read-iops"
+    krknhub_name: ClassVar[str] = "READ_IOPS"
+    krknctl_name: ClassVar[str] = "read-iops"
     value: int = 100
 
     def mutate(self):
         self.value = rng.randint(10, 500)
 
 
+@parameter_dataclass
 class WriteIOPSParameter(BaseParameter):
-    krknhub_name: str = "WRITE_IOPS"
-    krknctl_name: str = "write-iops"
+    krknhub_name: ClassVar[str] = "WRITE_IOPS"
+    krknctl_name: ClassVar[str] = "write-iops"
     value: int = 50
 
     def mutate(self):
         self.value = rng.randint(10, 500)
 
 
+@parameter_dataclass
 class ReadBPSParameter(BaseParameter):
-    krknhub_name: str = "READ_BPS"
-    krknctl_name: str = "read-bps"
+    krknhub_name: ClassVar[str] = "READ_BPS"
+    krknctl_name: ClassVar[str] = "read-bps"
     value: int = 1048576  # 1Mi in bytes (1024 * 1024)
 
     def get_value(self, return_krknhub_name: bool = False):
@@ -598,9 +671,10 @@ class ReadBPSParameter(BaseParameter):
         self.value = rng.randint(256 * 1024, 10 * 1024 * 1024)
 
 
+@parameter_dataclass
 class WriteBPSParameter(BaseParameter):
-    krknhub_name: str = "WRITE_BPS"
-    krknctl_name: str = "write-bps"
+    krknhub_name: ClassVar[str] = "WRITE_BPS"
+    krknctl_name: ClassVar[str] = "write-bps"
     value: int = 524288  # 512Ki in bytes (512 * 1024)
 
     def get_value(self, return_krknhub_name: bool = False):
@@ -615,13 +689,15 @@ class WriteBPSParameter(BaseParameter):
         self.value = rng.randint(128 * 1024, 5 * 1024 * 1024)
 
 
+@parameter_dataclass
 class MountPathParameter(BaseParameter):
-    krknhub_name: str = "MOUNT_PATH"
-    krknctl_name: str = "mount-path"
+    krknhub_name: ClassVar[str] = "MOUNT_PATH"
+    krknctl_name: ClassVar[str] = "mount-path"
     value: str = ""
 
 
+@parameter_dataclass
 class StorageThrottleImageParameter(BaseParameter):
-    krknhub_name: str = "IMAGE"
-    krknctl_name: str = "image"
+    krknhub_name: ClassVar[str] = "IMAGE"
+    krknctl_name: ClassVar[str] = "image"
     value: str = "quay.io/krkn-chaos/krkn:tools"
@@ -1,5 +1,4 @@
-from typing import List, Tuple
-from krkn_ai.models.cluster_components import Namespace, Pod
+from typing import ClassVar, Tuple
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
 from krkn_ai.models.scenario.parameters import (
@@ -11,6 +10,9 @@ from krkn_ai.models.scenario.parameters import (
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 
 
+_BLOCK_TRAFFIC_TYPES = ("[Ingress, Egress]", "[Ingress]", "[Egress]")
+
+
 class AppOutageScenario(Scenario):
     name: str = "application-outages"
     krknctl_name: str = "application-outages"
@@ -23,27 +25,16 @@ class AppOutageScenario(Scenario):
     pod_selector: PodSelectorParameter = PodSelectorParameter()
     block_traffic_type: BlockTrafficType = BlockTrafficType()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.namespace,
-            self.duration,
-            self.pod_selector,
-            self.block_traffic_type,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "namespace",
+        "duration",
+        "pod_selector",
+        "block_traffic_type",
+    )
 
     def mutate(self):
-        namespace_pod_tuple: List[Tuple[Namespace, Pod]] = []
-
         # look for pods with labels
-        for namespace in self._cluster_components.namespaces:
-            for pod in namespace.pods:
-                if len(pod.labels) > 0:
-                    namespace_pod_tuple.append((namespace, pod))
+        namespace_pod_tuple = self._cluster_components.labelled_pods
 
         if len(namespace_pod_tuple) == 0:
             raise ScenarioParameterInitError(
@@ -53,7 +44,7 @@ class AppOutageScenario(Scenario):
         # Select a random namespace and pod from the tuple list
         namespace, pod = rng.choice(namespace_pod_tuple)
         labels = pod.labels
-        label = rng.choice(list(labels.keys()))
+        label = rng.choice(pod.label_keys)
 
         # Update parameter values
         self.namespace.value = namespace.name
@@ -61,6 +52,4 @@ class AppOutageScenario(Scenario):
         # pod_selector is a string of the form "{app: foo}"
         self.pod_selector.value = f"{{{label}: {labels[label]}}}"
 
-        self.block_traffic_type.value = rng.choice(
-            ["[Ingress, Egress]", "[Ingress]", "[Egress]"]
-        )
+        self.block_traffic_type.value = rng.pick(_BLOCK_TRAFFIC_TYPES)
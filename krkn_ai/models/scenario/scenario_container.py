@@ -1,5 +1,5 @@
-from typing import List, Tuple
-from krkn_ai.models.cluster_components import Namespace, Pod
+from typing import ClassVar, Tuple
+from krkn_ai.models.cluster_components import Pod
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
@@ -12,6 +12,9 @@ from krkn_ai.models.scenario.parameters import (
     NamespaceParameter,
 )
 
+# Signals sent to the targeted containers: SIGHUP or SIGKILL.
+_SIGNALS = ("1", "9")
+
 
 class ContainerScenario(Scenario):
     name: str = "container-scenarios"
@@ -27,32 +30,21 @@ class ContainerScenario(Scenario):
     action: ActionParameter = ActionParameter()
     exp_recovery_time: ExpRecoveryTimeParameter = ExpRecoveryTimeParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.namespace,
-            self.label_selector,
-            self.disruption_count,
-            self.container_name,
-            self.action,
-            self.exp_recovery_time,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "namespace",
+        "label_selector",
+        "disruption_count",
+        "container_name",
+        "action",
+        "exp_recovery_time",
+    )
 
     def mutate(self):
-        namespace_pod_tuple: List[Tuple[Namespace, Pod]] = []
-
         # look for pods with labels and at least one container. A pod without
         # containers cannot be targeted by a container scenario and would make the
         # ``rng.randint(1, len(pod.containers))`` call below crash with
         # "ValueError: low >= high", terminating the whole GA run.
-        for namespace in self._cluster_components.namespaces:
-            for pod in namespace.pods:
-                if len(pod.labels) > 0 and len(pod.containers) > 0:
-                    namespace_pod_tuple.append((namespace, pod))
+        namespace_pod_tuple = self._cluster_components.labelled_pods_with_containers
 
         if len(namespace_pod_tuple) == 0:
             raise ScenarioParameterInitError(
@@ -62,7 +54,7 @@ class ContainerScenario(Scenario):
         # Select a random namespace and pod from the tuple list
         namespace, pod = rng.choice(namespace_pod_tuple)
         labels = pod.labels
-        label = rng.choice(list(labels.keys()))
+        label = rng.choice(pod.label_keys)
 
         self.namespace.value = namespace.name
 
@@ -74,7 +66,7 @@ class ContainerScenario(Scenario):
         # It is chosen before the disruption count because it constrains which
         # pods can actually be targeted. (#277)
         if rng.random() < 0.5:
-            self.container_name.value = rng.choice([x.name for x in pod.containers])
+            self.container_name.value = rng.choice(pod.container_names)
         else:
             self.container_name.value = ".*"
 
@@ -86,7 +78,7 @@ class ContainerScenario(Scenario):
                 return False
             if target_container == ".*":
                 return len(candidate.containers) > 0
-            return any(c.name == target_container for c in candidate.containers)
+            return target_container in candidate.container_names
 
         # DISRUPTION_COUNT is the number of *pods* to disrupt, not the container
         # count of a single pod. Only pods that also contain the targeted
@@ -96,4 +88,4 @@ class ContainerScenario(Scenario):
         matching_pod_count = sum(1 for p in namespace.pods if is_targetable(p))
         self.disruption_count.value = rng.randint(1, matching_pod_count)
 
-        self.action.value = rng.choice(["1", "9"])
+        self.action.value = rng.pick(_SIGNALS)
@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.cluster import select_nodes
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.models.scenario.base import Scenario
@@ -26,22 +27,16 @@ class NodeCPUHogScenario(Scenario):
     number_of_nodes: NumberOfNodesParameter = NumberOfNodesParameter()
     hog_scenario_image: HogScenarioImageParameter = HogScenarioImageParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.chaos_duration,
-            # self.node_cpu_core,
-            self.node_cpu_percentage,
-            self.namespace,
-            self.node_selector,
-            self.taint,
-            self.number_of_nodes,
-            self.hog_scenario_image,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "chaos_duration",
+        # "node_cpu_core",
+        "node_cpu_percentage",
+        "namespace",
+        "node_selector",
+        "taint",
+        "number_of_nodes",
+        "hog_scenario_image",
+    )
 
     def mutate(self):
         """Mutate CPU hog scenario parameters by selecting target nodes."""
@@ -53,7 +48,10 @@ class NodeCPUHogScenario(Scenario):
             )
 
         # Use shared node selection logic
-        result = select_nodes(nodes)
+        components = self._cluster_components
+        result = select_nodes(
+            nodes, components.node_label_index, components.node_label_keys
+        )
 
         self.node_selector.value = result.node_selector
         self.number_of_nodes.value = result.number_of_nodes
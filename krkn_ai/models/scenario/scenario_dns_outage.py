@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
@@ -25,26 +26,18 @@ class DnsOutageScenario(Scenario):
     protocol: DNSOutageProtocolParameter = DNSOutageProtocolParameter()
     ports: DNSPortParameter = DNSPortParameter(value="53")
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            # self.duration,
-            self.pod_name,
-            self.namespace,
-            self.ingress,
-            self.egress,
-            self.protocol,
-            self.ports,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        # "duration",
+        "pod_name",
+        "namespace",
+        "ingress",
+        "egress",
+        "protocol",
+        "ports",
+    )
 
     def mutate(self):
-        pods = [
-            (ns, pod) for ns in self._cluster_components.namespaces for pod in ns.pods
-        ]
+        pods = self._cluster_components.all_pods
 
         if len(pods) == 0:
             raise ScenarioParameterInitError("No pods found in cluster components")
@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.models.scenario.base import Scenario
 from krkn_ai.models.scenario.parameters import (
     DummyEndParameter,
@@ -13,15 +14,10 @@ class DummyScenario(Scenario):
     end: DummyEndParameter = DummyEndParameter()
     exit_status: DummyExitStatusParameter = DummyExitStatusParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-
-    @property
-    def parameters(self):
-        return [
-            self.end,
-            self.exit_status,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "end",
+        "exit_status",
+    )
 
     def mutate(self):
         pass
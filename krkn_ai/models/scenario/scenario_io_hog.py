@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.cluster import select_nodes
 from krkn_ai.models.scenario.base import Scenario
 from krkn_ai.models.scenario.parameters import (
@@ -31,24 +32,18 @@ class NodeIOHogScenario(Scenario):
     number_of_nodes: NumberOfNodesParameter = NumberOfNodesParameter()
     hog_scenario_image: HogScenarioImageParameter = HogScenarioImageParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.chaos_duration,
-            self.io_block_size,
-            self.io_workers,
-            self.io_write_bytes,
-            self.node_mount_path,
-            self.namespace,
-            self.node_selector,
-            self.taint,
-            self.number_of_nodes,
-            self.hog_scenario_image,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "chaos_duration",
+        "io_block_size",
+        "io_workers",
+        "io_write_bytes",
+        "node_mount_path",
+        "namespace",
+        "node_selector",
+        "taint",
+        "number_of_nodes",
+        "hog_scenario_image",
+    )
 
     def mutate(self):
         """Mutate IO hog scenario parameters by selecting target nodes."""
@@ -60,7 +55,10 @@ class NodeIOHogScenario(Scenario):
             )
 
         # Use shared node selection logic
-        result = select_nodes(nodes)
+        components = self._cluster_components
+        result = select_nodes(
+            nodes, components.node_label_index, components.node_label_keys
+        )
 
         self.node_selector.value = result.node_selector
         self.number_of_nodes.value = result.number_of_nodes
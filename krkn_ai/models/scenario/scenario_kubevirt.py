@@ -7,8 +7,7 @@ from krkn_ai.models.scenario.parameters import (
     VMTimeoutParameter,
 )
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
-from krkn_ai.models.cluster_components import Namespace, VMI
-from typing import List, Tuple
+from typing import ClassVar, Tuple
 
 
 class KubevirtDisruptionScenario(Scenario):
@@ -21,18 +20,12 @@ class KubevirtDisruptionScenario(Scenario):
     namespace: NamespaceParameter = NamespaceParameter()
     kill_count: KillCountParameter = KillCountParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.timeout,
-            self.vm_name,
-            self.namespace,
-            self.kill_count,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "timeout",
+        "vm_name",
+        "namespace",
+        "kill_count",
+    )
 
     def mutate(self):
         if len(self._cluster_components.namespaces) == 0:
@@ -40,11 +33,7 @@ class KubevirtDisruptionScenario(Scenario):
                 "No namespaces found in cluster components"
             )
 
-        namespaces: List[Tuple[Namespace, VMI]] = []  # (namespace, vm)
-
-        for ns in self._cluster_components.namespaces:
-            if len(ns.vmis) > 0:
-                namespaces.extend((ns, vmi) for vmi in ns.vmis)
+        namespaces = self._cluster_components.all_vmis  # (namespace, vm)
 
         # Check availability before mutation - skip test if no vms found
         if not namespaces:
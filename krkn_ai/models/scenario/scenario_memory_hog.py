@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.cluster import select_nodes
 from krkn_ai.models.scenario.base import Scenario
@@ -29,22 +30,16 @@ class NodeMemoryHogScenario(Scenario):
     number_of_nodes: NumberOfNodesParameter = NumberOfNodesParameter()
     hog_scenario_image: HogScenarioImageParameter = HogScenarioImageParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.chaos_duration,
-            self.node_memory_percentage,
-            self.number_of_workers,
-            self.namespace,
-            self.node_selector,
-            self.taint,
-            self.number_of_nodes,
-            self.hog_scenario_image,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "chaos_duration",
+        "node_memory_percentage",
+        "number_of_workers",
+        "namespace",
+        "node_selector",
+        "taint",
+        "number_of_nodes",
+        "hog_scenario_image",
+    )
 
     def mutate(self):
         """Mutate memory hog scenario parameters by selecting target nodes."""
@@ -56,7 +51,10 @@ class NodeMemoryHogScenario(Scenario):
             )
 
         # Use shared node selection logic
-        result = select_nodes(nodes)
+        components = self._cluster_components
+        result = select_nodes(
+            nodes, components.node_label_index, components.node_label_keys
+        )
 
         self.node_selector.value = result.node_selector
         self.number_of_nodes.value = result.number_of_nodes
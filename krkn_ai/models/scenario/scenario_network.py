@@ -46,10 +46,6 @@ class NetworkScenario(Scenario):
         NetworkScenarioTargetNodeInterfaceParameter()
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
     @property
     def parameters(self):
         common = [
@@ -76,10 +72,7 @@ class NetworkScenario(Scenario):
         return config_wait_duration
 
     def mutate(self):
-        # Get nodes with interfaces
-        nodes = [
-            node for node in self._cluster_components.nodes if len(node.interfaces) > 0
-        ]
+        nodes = self._cluster_components.nodes_with_interfaces
 
         if len(nodes) == 0:
             raise ScenarioParameterInitError(
@@ -90,13 +83,14 @@ class NetworkScenario(Scenario):
         self.execution.mutate()
 
         node = rng.choice(nodes)
+        interfaces = node.interfaces
         self.node_name.value = node.name
-        self.interfaces.value = f"[{rng.choice(node.interfaces)}]"
+        self.interfaces.value = f"[{rng.choice(interfaces)}]"
 
         if self.traffic_type.value == "ingress":
             self.network_params.mutate()
             self.target_node_interface.value = (
-                "{" + f"{node.name}: [{rng.choice(node.interfaces)}]" + "}"
+                f"{{{node.name}: [{rng.choice(interfaces)}]}}"
             )
         elif self.traffic_type.value == "egress":
             self.egress_params.mutate()
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import ClassVar, Tuple
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
@@ -10,7 +10,6 @@ from krkn_ai.models.scenario.parameters import (
     NamespaceParameter,
     PodLabelParameter,
 )
-from krkn_ai.models.cluster_components import Namespace, Pod
 
 
 class PodScenario(Scenario):
@@ -25,29 +24,18 @@ class PodScenario(Scenario):
     kill_timeout: KillTimeoutParameter = KillTimeoutParameter()
     exp_recovery_time: ExpRecoveryTimeParameter = ExpRecoveryTimeParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.namespace,
-            self.pod_label,
-            self.name_pattern,
-            self.disruption_count,
-            self.kill_timeout,
-            self.exp_recovery_time,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "namespace",
+        "pod_label",
+        "name_pattern",
+        "disruption_count",
+        "kill_timeout",
+        "exp_recovery_time",
+    )
 
     def mutate(self):
-        namespace_pod_tuple: List[Tuple[Namespace, Pod]] = []
-
         # look for pods with labels
-        for namespace in self._cluster_components.namespaces:
-            for pod in namespace.pods:
-                if len(pod.labels) > 0:
-                    namespace_pod_tuple.append((namespace, pod))
+        namespace_pod_tuple = self._cluster_components.labelled_pods
 
         if len(namespace_pod_tuple) == 0:
             raise ScenarioParameterInitError(
@@ -56,11 +44,10 @@ class PodScenario(Scenario):
 
         # Select a random namespace and pod from the tuple list
         namespace, pod = rng.choice(namespace_pod_tuple)
-        labels = pod.labels
-        label = rng.choice(list(labels.keys()))
+        pod_label = rng.choice(pod.label_selectors)
 
         # Update parameter values
         self.namespace.value = namespace.name
 
         # pod_label is a string of the form "key=value"
-        self.pod_label.value = "{}={}".format(label, labels[label])
+        self.pod_label.value = pod_label
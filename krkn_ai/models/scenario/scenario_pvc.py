@@ -1,4 +1,3 @@
-from typing import List, Tuple
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
@@ -9,7 +8,6 @@ from krkn_ai.models.scenario.parameters import (
     PVCNameParameter,
     StandardDurationParameter,
 )
-from krkn_ai.models.cluster_components import Namespace, Pod, PVC
 from krkn_ai.cluster import get_pvc_usage_percentage
 from krkn_ai.utils.logger import get_logger
 
@@ -27,10 +25,6 @@ class PVCScenario(Scenario):
     fill_percentage: FillPercentageParameter = FillPercentageParameter()
     duration: StandardDurationParameter = StandardDurationParameter(value=60)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
     @property
     def parameters(self):
         # pvc-name and pod-name are mutually exclusive, at least one is required
@@ -51,14 +45,8 @@ class PVCScenario(Scenario):
                 "No namespaces found in cluster components"
             )
 
-        namespace_pvc_tuple: List[Tuple[Namespace, PVC]] = []  # (namespace, pvc)
-        namespace_pod_tuple: List[Tuple[Namespace, Pod]] = []  # (namespace, pod)
-
-        for namespace in self._cluster_components.namespaces:
-            if namespace.pvcs:
-                namespace_pvc_tuple.extend((namespace, pvc) for pvc in namespace.pvcs)
-            if namespace.pods:
-                namespace_pod_tuple.extend((namespace, pod) for pod in namespace.pods)
+        namespace_pvc_tuple = self._cluster_components.all_pvcs
+        namespace_pod_tuple = self._cluster_components.all_pods
 
         # Check availability before mutation - skip test if no PVCs or pods found
         if not namespace_pvc_tuple and not namespace_pod_tuple:
@@ -30,10 +30,6 @@ class ServiceDisruptionScenario(Scenario):
     delete_count: DeleteCountParameter = DeleteCountParameter()
     runs: RunsParameter = RunsParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
     @property
     def parameters(self):
         # NAMESPACE and LABEL_SELECTOR are mutually exclusive in krkn;
@@ -45,7 +41,7 @@ class ServiceDisruptionScenario(Scenario):
         return params
 
     def mutate(self):
-        candidates = [ns for ns in self._cluster_components.namespaces if ns.services]
+        candidates = self._cluster_components.namespaces_with_services
         if not candidates:
             raise ScenarioParameterInitError(
                 "No namespaces with services found for service disruption scenario"
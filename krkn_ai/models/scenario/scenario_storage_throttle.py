@@ -1,4 +1,3 @@
-from typing import List, Tuple
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
@@ -15,7 +14,6 @@ from krkn_ai.models.scenario.parameters import (
     WriteBPSParameter,
     WriteIOPSParameter,
 )
-from krkn_ai.models.cluster_components import Namespace, Pod, PVC
 from krkn_ai.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,10 +38,6 @@ class StorageThrottleScenario(Scenario):
     duration: StandardDurationParameter = StandardDurationParameter(value=60)
     image: StorageThrottleImageParameter = StorageThrottleImageParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
     @property
     def parameters(self):
         params = [self.namespace]
@@ -71,14 +65,8 @@ class StorageThrottleScenario(Scenario):
                 "No namespaces found in cluster components"
             )
 
-        namespace_pvc_tuple: List[Tuple[Namespace, PVC]] = []
-        namespace_pod_tuple: List[Tuple[Namespace, Pod]] = []
-
-        for namespace in self._cluster_components.namespaces:
-            if namespace.pvcs:
-                namespace_pvc_tuple.extend((namespace, pvc) for pvc in namespace.pvcs)
-            if namespace.pods:
-                namespace_pod_tuple.extend((namespace, pod) for pod in namespace.pods)
+        namespace_pvc_tuple = self._cluster_components.all_pvcs
+        namespace_pod_tuple = self._cluster_components.all_pods
 
         if not namespace_pvc_tuple and not namespace_pod_tuple:
             raise ScenarioParameterInitError(
@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
 from krkn_ai.models.scenario.parameters import (
@@ -33,32 +34,21 @@ class SynFloodScenario(Scenario):
     image: SynFloodImageParameter = SynFloodImageParameter()
     node_selectors: SynFloodNodeSelectorsParameter = SynFloodNodeSelectorsParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.packet_size,
-            self.window_size,
-            self.chaos_duration,
-            self.namespace,
-            self.target_service,
-            self.target_port,
-            self.target_service_label,
-            self.number_of_pods,
-            self.image,
-            self.node_selectors,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "packet_size",
+        "window_size",
+        "chaos_duration",
+        "namespace",
+        "target_service",
+        "target_port",
+        "target_service_label",
+        "number_of_pods",
+        "image",
+        "node_selectors",
+    )
 
     def mutate(self):
-        namespace_candidates = [
-            ns
-            for ns in self._cluster_components.namespaces
-            if getattr(ns, "services", None)
-            and any(service.ports for service in ns.services)
-        ]
+        namespace_candidates = self._cluster_components.namespaces_with_service_ports
 
         if len(namespace_candidates) == 0:
             raise ScenarioParameterInitError(
@@ -68,9 +58,7 @@ class SynFloodScenario(Scenario):
         namespace = rng.choice(namespace_candidates)
         self.namespace.value = namespace.name
 
-        services_with_ports = [
-            service for service in namespace.services if service.ports
-        ]
+        services_with_ports = namespace.services_with_ports
 
         if len(services_with_ports) == 0:
             raise ScenarioParameterInitError(
@@ -80,7 +68,7 @@ class SynFloodScenario(Scenario):
         service = rng.choice(services_with_ports)
         self.target_service.value = service.name
 
-        available_ports = [port.port for port in service.ports if port.port]
+        available_ports = service.port_numbers
         if len(available_ports) == 0:
             raise ScenarioParameterInitError(
                 f"No valid ports found for service {service.name} in namespace {namespace.name}"
@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from krkn_ai.models.custom_errors import ScenarioParameterInitError
 from krkn_ai.utils.rng import rng
 from krkn_ai.models.scenario.base import Scenario
@@ -21,38 +22,19 @@ class TimeScenario(Scenario):
     container_name: ContainerNameParameter = ContainerNameParameter()
     namespace: NamespaceParameter = NamespaceParameter()
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.mutate()
-
-    @property
-    def parameters(self):
-        return [
-            self.object_type,
-            self.label_selector,
-            self.action_time,
-            self.container_name,
-            self.namespace,
-        ]
+    parameter_names: ClassVar[Tuple[str, ...]] = (
+        "object_type",
+        "label_selector",
+        "action_time",
+        "container_name",
+        "namespace",
+    )
 
     def mutate(self):
         # Pre-check if data is available for scenario
-        namespace = rng.choice(
-            [
-                namespace
-                for namespace in self._cluster_components.namespaces
-                if len(namespace.pods) > 0
-            ]
-        )
-        all_pod_labels = set()
-        for p in namespace.pods:
-            for label, value in p.labels.items():
-                all_pod_labels.add(f"{label}={value}")
-
-        all_node_labels = set()
-        for n in self._cluster_components.nodes:
-            for label, value in n.labels.items():
-                all_node_labels.add(f"{label}={value}")
+        namespace = rng.choice(self._cluster_components.namespaces_with_pods)
+        all_pod_labels = namespace.pod_label_selectors
+        all_node_labels = self._cluster_components.node_label_keys
 
         if len(all_pod_labels) == 0 and len(all_node_labels) == 0:
             raise ScenarioParameterInitError(
@@ -70,8 +52,8 @@ class TimeScenario(Scenario):
 
         # Select a random label from the available labels
         if self.object_type.value == "pod":
-            self.label_selector.value = rng.choice(list(all_pod_labels))
+            self.label_selector.value = rng.choice(all_pod_labels)
             self.namespace.value = namespace.name
         else:
-            self.label_selector.value = rng.choice(list(all_node_labels))
+            self.label_selector.value = rng.choice(all_node_labels)
             self.namespace.value = ""
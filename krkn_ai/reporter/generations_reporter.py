@@ -1,15 +1,7 @@
-import json
 import os
 from typing import List
 
-import yaml
-
-import matplotlib
-
-matplotlib.use("Agg")
-import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
+from pydantic_core import to_json
 
 from krkn_ai.models.app import CommandRunResult
 from krkn_ai.utils.logger import get_logger
@@ -37,35 +29,47 @@ class GenerationsReporter:
             result.fitness_result.fitness_score for result in best_generations
         ]
 
-        sns.lineplot(x=generation_ids, y=fitness_scores, marker="o")
-        plt.title("Best Generation Fitness Score")
-        plt.xlabel("Generation")
-        plt.ylabel("Fitness Score")
+        # Deferred so importing the reporter does not pull in matplotlib.
+        from matplotlib.figure import Figure  # noqa: PLC0415
+        from matplotlib.ticker import MaxNLocator  # noqa: PLC0415
+
+        # A standalone Figure avoids pyplot's global state and seaborn's
+        # DataFrame round-trip for what is a single two-array line plot.
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot(generation_ids, fitness_scores, marker="o")
+        ax.set_title("Best Generation Fitness Score")
+        ax.set_xlabel("Generation")
+        ax.set_ylabel("Fitness Score")
 
         # Force x-axis to show only integer values
-        plt.gca().xaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
 
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(save_path, dpi=300)
         logger.debug("Best generation graph saved to %s", save_path)
 
     def save_best_generations(self, best_generations: List[CommandRunResult]):
         output_dir = os.path.join(self.output_dir, "reports")
         os.makedirs(output_dir, exist_ok=True)
         save_path = os.path.join(output_dir, "best_scenarios.%s" % self.format)
-        results = []
+        # mode="json" renders datetimes as ISO strings; the log is excluded up
+        # front rather than serialized and discarded.
+        results = [
+            result.model_dump(mode="json", exclude={"log"})
+            for result in best_generations
+        ]
         with open(save_path, "w", encoding="utf-8") as f:
-            for i in range(len(best_generations)):
-                scenario_result = best_generations[i].model_dump()
-                del scenario_result["log"]
-                scenario_result["start_time"] = (
-                    scenario_result["start_time"]
-                ).isoformat()
-                scenario_result["end_time"] = (scenario_result["end_time"]).isoformat()
-                results.append(scenario_result)
             if self.format == "json":
-                json.dump(results, f, indent=4)
+                # pydantic-core's Rust encoder is much faster than json.dump
+                # on long GA histories.
+                f.write(to_json(results, indent=4).decode("utf-8"))
             elif self.format == "yaml":
-                yaml.dump(results, f, sort_keys=False, width=float("inf"))
+                import yaml  # noqa: PLC0415
+
+                # Results are plain JSON-mode data, so the libyaml-backed safe
+                # dumper applies when PyYAML was built with it. libyaml needs an
+                # integer line width, hence the C int max instead of inf.
+                dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                yaml.dump(results, f, Dumper=dumper, sort_keys=False, width=2**31 - 1)
             logger.debug("Best generation report saved to %s", save_path)
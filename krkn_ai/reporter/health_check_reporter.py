@@ -1,16 +1,7 @@
+import csv
 import os
-import pandas as pd
 
-import matplotlib
-
-matplotlib.use("Agg")
-import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.dates import DateFormatter
-from matplotlib.ticker import MaxNLocator
-
-from typing import List
+from typing import List, Optional
 
 from krkn_ai.models.app import CommandRunResult
 from krkn_ai.models.scenario.base import Scenario
@@ -19,12 +10,24 @@ from krkn_ai.utils.output import format_result_filename
 
 logger = get_logger(__name__)
 
+_HEALTH_CHECK_REPORT_COLUMNS = (
+    "scenario_id",
+    "component_name",
+    "min_response_time",
+    "max_response_time",
+    "average_response_time",
+    "success_count",
+    "failure_count",
+)
+
 
 class HealthCheckReporter:
     def __init__(self, output_dir: str, output_config=None):
         self.output_dir = os.path.join(output_dir, "reports")
         self.output_config = output_config
         os.makedirs(self.output_dir, exist_ok=True)
+        # Header of all.csv as last written, loaded from disk on first use.
+        self._fitness_columns: Optional[List[str]] = None
 
     def save_report(self, fitness_results: List[CommandRunResult]):
         logger.debug("Saving health check report")
@@ -41,34 +44,30 @@ class HealthCheckReporter:
                         scenario_id,
                     )
                     continue
-                component_name = component_results[0].name
-                min_response_time = min(
-                    [result.response_time for result in component_results]
-                )
-                max_response_time = max(
-                    [result.response_time for result in component_results]
-                )
-                average_response_time = sum(
-                    [result.response_time for result in component_results]
-                ) / len(component_results)
-                success_count = sum([result.success for result in component_results])
-                failure_count = len(component_results) - success_count
+                # Collect response times once for the min/max/mean below
+                response_times = [result.response_time for result in component_results]
+                success_count = sum(result.success for result in component_results)
 
                 results.append(
                     {
                         "scenario_id": scenario_id,
-                        "component_name": component_name,
-                        "min_response_time": min_response_time,
-                        "max_response_time": max_response_time,
-                        "average_response_time": average_response_time,
+                        "component_name": component_results[0].name,
+                        "min_response_time": min(response_times),
+                        "max_response_time": max(response_times),
+                        "average_response_time": sum(response_times)
+                        / len(response_times),
                         "success_count": success_count,
-                        "failure_count": failure_count,
+                        "failure_count": len(component_results) - success_count,
                     }
                 )
 
-        data = pd.DataFrame(results)
+        # The aggregated rows are already uniform dicts, so they are written
+        # directly rather than through a DataFrame.
         report_path = os.path.join(self.output_dir, "health_check_report.csv")
-        data.to_csv(report_path, index=False)
+        with open(report_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=_HEALTH_CHECK_REPORT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(results)
         logger.debug("Health check report saved to %s", report_path)
 
     def plot_report(self, result: CommandRunResult):
@@ -94,33 +93,53 @@ class HealthCheckReporter:
 
         save_path = os.path.join(output_dir, graph_filename)
 
-        # Flatten the data
-        records = []
-        for _, health_check_results in result.health_check_results.items():
+        # Flatten the data into columns; timestamps are parsed in one call
+        applications: List[str] = []
+        timestamps: List[str] = []
+        response_times: List[float] = []
+        successes: List[int] = []
+        for health_check_results in result.health_check_results.values():
             for health_check_result in health_check_results:
-                records.append(
-                    {
-                        "application": health_check_result.name,
-                        "timestamp": pd.to_datetime(health_check_result.timestamp),
-                        "response_time": health_check_result.response_time,
-                        "success": 1 if health_check_result.success else 0,
-                    }
-                )
-        if not records:
+                applications.append(health_check_result.name)
+                timestamps.append(health_check_result.timestamp)
+                response_times.append(health_check_result.response_time)
+                successes.append(1 if health_check_result.success else 0)
+        if not applications:
             logger.debug(
                 "No health check records found to plot for scenario_id=%s",
                 result.scenario_id,
             )
             return
 
-        df = pd.DataFrame(records)
+        # Deferred so that runs which only write CSV results never import the
+        # plotting stack. Figure renders through the Agg canvas without pyplot.
+        import numpy as np  # noqa: PLC0415
+        import pandas as pd  # noqa: PLC0415
+        from matplotlib.colors import LinearSegmentedColormap  # noqa: PLC0415
+        from matplotlib.dates import DateFormatter  # noqa: PLC0415
+        from matplotlib.figure import Figure  # noqa: PLC0415
+        from matplotlib.ticker import FuncFormatter, MaxNLocator  # noqa: PLC0415
+
+        # isoformat() drops zero microseconds, so the column may mix ISO
+        # variants; format="ISO8601" accepts all of them in a single pass.
+        df = pd.DataFrame(
+            {
+                "application": applications,
+                "timestamp": pd.to_datetime(timestamps, format="ISO8601", cache=True),
+                "response_time": response_times,
+                "success": successes,
+            }
+        )
         df = df.sort_values("timestamp")
 
         # Create formatted timestamp strings for display
         df["timestamp_str"] = df["timestamp"].dt.strftime("%M:%S")
 
-        # Create larger figure with better proportions
-        fig, axes = plt.subplots(2, 1, figsize=(15, 10))
+        # Create larger figure with better proportions. A standalone Figure
+        # with plain Axes calls skips pyplot's global state and seaborn's
+        # per-call dispatch; one graph is rendered per evaluated scenario.
+        fig = Figure(figsize=(15, 10))
+        axes = fig.subplots(2, 1)
 
         # Set main title for the entire plot
         fig.suptitle(
@@ -129,15 +148,15 @@ class HealthCheckReporter:
             fontweight="bold",
         )
 
-        # Plot 1: Line plot for response time
-        sns.lineplot(
-            data=df,
-            x="timestamp",
-            y="response_time",
-            hue="application",
-            marker="o",
-            ax=axes[0],
-        )
+        # Plot 1: Line plot for response time, one line per application
+        for application, app_df in df.groupby("application", sort=True):
+            axes[0].plot(
+                app_df["timestamp"],
+                app_df["response_time"],
+                marker="o",
+                label=application,
+            )
+        axes[0].legend(title="application")
 
         # Format line plot result
         axes[0].xaxis.set_major_locator(MaxNLocator())
@@ -150,45 +169,62 @@ class HealthCheckReporter:
 
         # Plot 2: Heatmap for success
         green_white = LinearSegmentedColormap.from_list("green_red", ["red", "green"])
-        pivot = df.pivot_table(
-            index="application",
-            columns="timestamp_str",
-            values="success",
-            aggfunc="max",
-            fill_value=1,
+        # Max success per (application, mm:ss) cell, 1 where there is no sample;
+        # a direct crosstab over factorized codes instead of pivot_table.
+        app_codes, app_labels = pd.factorize(df["application"], sort=True)
+        ts_codes, ts_labels = pd.factorize(df["timestamp_str"], sort=True)
+        success_grid: np.ndarray = np.full(
+            (len(app_labels), len(ts_labels)), -1, dtype=np.int8
+        )
+        np.maximum.at(
+            success_grid, (app_codes, ts_codes), df["success"].to_numpy(dtype=np.int8)
         )
-        sns.heatmap(
-            pivot,
+        success_grid[success_grid < 0] = 1
+        axes[1].imshow(
+            success_grid,
+            aspect="auto",
             cmap=green_white,
-            cbar=False,
-            ax=axes[1],
-            linewidths=0.3,
-            linecolor="gray",
-            annot=False,
+            interpolation="nearest",
             vmin=0,
             vmax=1,
+            rasterized=True,
         )
+        # Cell borders, drawn as a grid on minor ticks at the cell edges
+        axes[1].set_xticks(np.arange(len(ts_labels) + 1) - 0.5, minor=True)
+        axes[1].set_yticks(np.arange(len(app_labels) + 1) - 0.5, minor=True)
+        axes[1].grid(which="minor", color="gray", linewidth=0.3)
+        axes[1].tick_params(which="minor", length=0)
+        timestamp_labels = list(ts_labels)
         axes[1].set_title("Success per Application Over Time", fontsize=14)
-        # axes[1].set_xlabel("Time (mm:ss)", fontsize=12)
         axes[1].set_ylabel("Application", fontsize=12)
+        axes[1].set_yticks(range(len(app_labels)), labels=list(app_labels))
         axes[1].tick_params(axis="x", rotation=45, labelsize=10)
         axes[1].tick_params(axis="y", labelsize=10)
-        axes[1].xaxis.set_major_locator(MaxNLocator())
-
-        plt.tight_layout()
+        axes[1].xaxis.set_major_locator(MaxNLocator(integer=True))
+        axes[1].xaxis.set_major_formatter(
+            FuncFormatter(
+                lambda x, _: (
+                    timestamp_labels[int(x)]
+                    if 0 <= int(x) < len(timestamp_labels)
+                    else ""
+                )
+            )
+        )
 
-        plt.savefig(save_path, dpi=300)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(save_path, dpi=300)
 
         logger.debug("Health check graph saved to %s", save_path)
 
     def write_fitness_result(self, fitness_result: CommandRunResult):
         """
-        Write fitness result to a CSV file.
+        Append a fitness result row to the all.csv report.
 
-        To handle dynamic SLO columns that may vary between scenarios,
-        we read the existing CSV, concatenate the new row, and rewrite
-        the entire file. This ensures consistent columns across all rows.
+        Rows are appended in place, so the cost per call does not grow with the
+        number of results already written. SLO columns may vary between
+        scenarios; when a row brings columns not yet in the header, the file is
+        rewritten once with the widened header (existing rows leave the new
+        columns empty).
         """
         report_path = os.path.join(self.output_dir, "all.csv")
 
@@ -207,50 +243,80 @@ class HealthCheckReporter:
                 fitness_function_item.fitness_score
             )
 
-        new_row = pd.DataFrame(
-            [
-                {
-                    "generation_id": fitness_result.generation_id,
-                    "scenario_id": fitness_result.scenario_id,
-                    "scenario": fitness_result.scenario.name,
-                    "duration_seconds": fitness_result.duration_seconds,
-                    "parameters": " ".join(params),
-                    **fitness_function_slos,
-                    "health_check_failure_score": fitness_result.fitness_result.health_check_failure_score,
-                    "health_check_response_time_score": fitness_result.fitness_result.health_check_response_time_score,
-                    "krkn_failure_score": fitness_result.fitness_result.krkn_failure_score,
-                    "fitness_score": fitness_result.fitness_result.fitness_score,
-                }
-            ]
-        )
-
-        # Read existing data and concatenate with new row to ensure consistent columns
-        if os.path.isfile(report_path):
-            try:
-                existing_df = pd.read_csv(report_path)
-                df = pd.concat([existing_df, new_row], ignore_index=True)
-            except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
-                # File exists but is empty or malformed, start fresh
-                logger.warning(
-                    "Could not read existing CSV (%s), starting fresh: %s",
-                    report_path,
-                    e,
-                )
-                df = new_row
+        scores = fitness_result.fitness_result
+        new_row = {
+            "generation_id": fitness_result.generation_id,
+            "scenario_id": fitness_result.scenario_id,
+            "scenario": fitness_result.scenario.name,
+            "duration_seconds": fitness_result.duration_seconds,
+            "parameters": " ".join(params),
+            **fitness_function_slos,
+            "health_check_failure_score": scores.health_check_failure_score,
+            "health_check_response_time_score": (
+                scores.health_check_response_time_score
+            ),
+            "krkn_failure_score": scores.krkn_failure_score,
+            "fitness_score": scores.fitness_score,
+        }
+
+        columns = self._load_fitness_columns(report_path)
+        if not columns:
+            columns = list(new_row)
+            self._fitness_columns = columns
+            with open(report_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                writer.writerow(new_row)
         else:
-            df = new_row
-
-        df.to_csv(report_path, index=False)
+            new_columns = [column for column in new_row if column not in columns]
+            if new_columns:
+                columns = self._widen_fitness_csv(report_path, columns + new_columns)
+            with open(report_path, "a", newline="", encoding="utf-8") as f:
+                csv.DictWriter(f, fieldnames=columns).writerow(new_row)
         logger.debug("Fitness result updated.")
 
+    def _load_fitness_columns(self, report_path: str) -> List[str]:
+        """Return the all.csv header, reading it from disk the first time."""
+        if self._fitness_columns is None:
+            self._fitness_columns = []
+            if os.path.isfile(report_path):
+                with open(report_path, newline="", encoding="utf-8") as f:
+                    self._fitness_columns = next(csv.reader(f), [])
+        return self._fitness_columns
+
+    def _widen_fitness_csv(self, report_path: str, columns: List[str]) -> List[str]:
+        """
+        Rewrite all.csv with a wider header, leaving new columns empty, and
+        return the new header.
+        """
+        with open(report_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        with open(report_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+        self._fitness_columns = columns
+        return columns
+
     def sort_fitness_result_csv(self):
         """Read the CSV file, sort it by fitness_score, and write it back"""
         report_path = os.path.join(self.output_dir, "all.csv")
         if os.path.exists(report_path):
             try:
-                df = pd.read_csv(report_path)
-                df = df.sort_values(by="fitness_score", ascending=False)
-                df.to_csv(report_path, index=False)
+                # Sort the rows as written; a stable sort keeps equal scores in
+                # the order they were evaluated and the values are not re-parsed.
+                with open(report_path, newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None)
+                    rows = list(reader)
+                if header is None:
+                    return
+                score_index = header.index("fitness_score")
+                rows.sort(key=lambda row: float(row[score_index]), reverse=True)
+                with open(report_path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(header)
+                    writer.writerows(rows)
                 logger.debug("Fitness result CSV sorted by fitness_score")
             except Exception as e:
                 logger.exception("Unable to sort fitness results: %s", e)
@@ -133,14 +133,18 @@ class JSONSummaryReporter:
 
     def _build_fitness_progression(self) -> List[Dict[str, Any]]:
         """Build fitness progression data from best_of_generation."""
+        # Group scores by generation in one pass over seen_population, rather
+        # than rescanning the whole population for every generation.
+        scores_by_generation: Dict[int, List[float]] = {}
+        for r in self.seen_population.values():
+            scores_by_generation.setdefault(r.generation_id, []).append(
+                r.fitness_result.fitness_score
+            )
+
         fitness_progression = []
         for i, result in enumerate(self.best_of_generation):
             # Calculate average fitness for this generation from seen_population
-            gen_fitness_scores = [
-                r.fitness_result.fitness_score
-                for r in self.seen_population.values()
-                if r.generation_id == i
-            ]
+            gen_fitness_scores = scores_by_generation.get(i, [])
             gen_average = 0.0
             if gen_fitness_scores:
                 gen_average = sum(gen_fitness_scores) / len(gen_fitness_scores)
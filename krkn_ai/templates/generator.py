@@ -5,7 +5,11 @@ import yaml
 
 from krkn_ai.models.scenario.factory import scenario_specs
 
-environment = jinja2.Environment()
+# The template ships with the package and never changes at runtime, so it is
+# loaded and compiled once and then served from the environment's cache.
+environment = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.dirname(__file__)), auto_reload=False
+)
 
 # Add enumerate to the template environment so it's available in templates
 environment.globals["enumerate"] = enumerate
@@ -19,35 +23,19 @@ def create_krkn_ai_template(
     fitness_queries: list = None,
 ) -> str:
     """Create krkn-ai.yaml from template with proper indentation"""
-    # Get the directory of the current module
-    current_dir = os.path.dirname(__file__)
-    template_path = os.path.join(current_dir, "krkn-ai.yaml.j2")
+    template = environment.get_template("krkn-ai.yaml.j2")
 
-    with open(template_path, encoding="utf-8") as f:
-        template_str = f.read()
-    template = environment.from_string(template_str)
-
-    # Convert cluster_components to properly indented YAML string
+    # Convert cluster_components to YAML; the template indents it by 2 spaces
     cluster_components_yaml = yaml.dump(
         cluster_component_data, default_flow_style=False, indent=2, allow_unicode=True
     ).strip()
 
-    # Manually indent each line by 2 spaces
-    indented_lines = []
-    for line in cluster_components_yaml.split("\n"):
-        if line.strip():  # Only indent non-empty lines
-            indented_lines.append("  " + line)
-        else:
-            indented_lines.append("")  # Keep empty lines as-is
-
-    cluster_components_indented = "\n".join(indented_lines)
-
     if scenario_enables is None:
         scenario_enables = {name: False for name, _ in scenario_specs}
 
     return template.render(
         kubeconfig_file_path=kubeconfig_file_path,
-        cluster_components=cluster_components_indented,
+        cluster_components=cluster_components_yaml,
         scenario_enables=scenario_enables,
         fitness_queries=fitness_queries,
         health_check_apps=health_checks,
@@ -46,9 +46,12 @@ def run_shell(command, do_not_log=False, timeout=None):
     output_lines = []
 
     def _read_output():
+        if do_not_log:
+            # Nothing is logged per line, so drain the pipe in one read.
+            output_lines.append(process.stdout.read())
+            return
         for line in process.stdout:
-            if not do_not_log:
-                logger.debug("%s", line.rstrip())
+            logger.debug("%s", line.rstrip())
             output_lines.append(line)
 
     reader = threading.Thread(target=_read_output, daemon=True)
@@ -13,6 +13,37 @@ from krkn_lib.elastic.krkn_elastic import KrknElastic
 
 logger = get_logger(__name__)
 
+# Hack to prevent any logging from KrknElastic client. Set up once: getLogger
+# returns the same instance, so adding a handler per client would pile them up.
+_null_logger = logging.getLogger("null")
+if not _null_logger.handlers:
+    _null_logger.addHandler(logging.NullHandler())
+
+# Config fields relevant for indexing (excludes kubeconfig, elastic creds, etc.)
+_CONFIG_FIELDS = {
+    "algorithm",
+    "genetic",
+    "wait_duration",
+    "fitness_function",
+    "health_checks",
+    "scenario",
+    "cluster_components",
+}
+
+# Fields indexed from each scenario run result
+_RESULT_FIELDS = {
+    "generation_id",
+    "scenario_id",
+    "cmd",
+    "returncode",
+    "start_time",
+    "end_time",
+    "fitness_result",
+    "health_check_results",
+    "run_uuid",
+    "resiliency_score",
+}
+
 
 class ElasticSearchClient:
     """
@@ -28,15 +59,11 @@ class ElasticSearchClient:
         """
         self.config = config
 
-        # Hack to prevent any logging from KrknElastic client
-        null_logger = logging.getLogger("null")
-        null_logger.addHandler(logging.NullHandler())
-
         self.client = None
         if self.config.enable:
             try:
                 self.client = KrknElastic(
-                    safe_logger=null_logger,
+                    safe_logger=_null_logger,
                     elastic_url=self.config.server,
                     elastic_port=self.config.port,
                     username=self.config.username,
@@ -92,19 +119,7 @@ class ElasticSearchClient:
 
         INDEX_NAME = f"{self.config.index}-config"
 
-        # Serialize only the fields relevant for indexing (excludes kubeconfig, elastic creds, etc.)
-        config_data = config.model_dump(
-            mode="json",
-            include={
-                "algorithm",
-                "genetic",
-                "wait_duration",
-                "fitness_function",
-                "health_checks",
-                "scenario",
-                "cluster_components",
-            },
-        )
+        config_data = config.model_dump(mode="json", include=_CONFIG_FIELDS)
         config_data["run_uuid"] = run_uuid
 
         status = self.client.upload_data_to_elasticsearch(
@@ -157,21 +172,7 @@ class ElasticSearchClient:
 
         INDEX_NAME = f"{self.config.index}-results"
 
-        result_data = result.model_dump(
-            mode="json",
-            include={
-                "generation_id",
-                "scenario_id",
-                "cmd",
-                "returncode",
-                "start_time",
-                "end_time",
-                "fitness_result",
-                "health_check_results",
-                "run_uuid",
-                "resiliency_score",
-            },
-        )
+        result_data = result.model_dump(mode="json", include=_RESULT_FIELDS)
         result_data["krkn_ai_run_uuid"] = run_uuid  # Link to parent config for the test
         result_data["scenario"] = result.scenario.name
 
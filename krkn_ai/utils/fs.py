@@ -1,8 +1,10 @@
 import json
 import os
+import re
 import yaml
 from collections.abc import Sequence
-from typing import Union, List, Dict
+from functools import lru_cache
+from typing import Union, List, Dict, Tuple
 
 from pydantic import ValidationError
 
@@ -13,15 +15,28 @@ from krkn_ai.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Use the libyaml-backed safe loader/dumper when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=32)
+def _param_pattern(keys: Tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation matching any "$key", preferring the longest key."""
+    ordered = sorted(keys, key=len, reverse=True)
+    return re.compile(r"\$(" + "|".join(map(re.escape, ordered)) + ")")
+
 
 def preprocess_param_string(data: str, params: dict) -> str:
     """
     Preprocess the health check url to replace the parameters with the values.
     """
     data = str(data)
-    for k, v in params.items():
-        data = data.replace(f"${k}", v)
-    return data
+    if not params or "$" not in data:
+        return data
+    # One pass over the string: "$foobar" is never clobbered by a "foo"
+    # parameter, and substituted values are not expanded again.
+    return _param_pattern(tuple(params)).sub(lambda m: params[m.group(1)], data)
 
 
 def read_config_from_file(
@@ -37,7 +52,7 @@ def read_config_from_file(
         ConfigFile: Config file object
     """
     with open(file_path, "r", encoding="utf-8") as stream:
-        config = yaml.safe_load(stream)
+        config = yaml.load(stream, Loader=_YAML_LOADER)
     if config is None:
         config = {}
 
@@ -109,7 +124,7 @@ def save_data_to_file(data: Union[Dict, List], file_path: str):
     format = file_path.split(".")[-1]
     if format == "yaml":
         with open(file_path, "w") as f:
-            yaml.dump(data, f)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER)
     elif format == "json":
         with open(file_path, "w") as f:
             json.dump(data, f, indent=4)
@@ -180,7 +195,7 @@ def _build_merged_config(
         return None
     # edit the raw file so user fields aren't dropped on a model dump
     with open(output, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=_YAML_LOADER) or {}
     merged = merge_components(config.cluster_components, discovered)
     raw["cluster_components"] = merged.model_dump(
         mode="json", warnings="none", exclude_defaults=True
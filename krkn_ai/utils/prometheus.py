@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from kubernetes import client, config
 from krkn_lib.prometheus.krkn_prometheus import KrknPrometheus
 from krkn_ai.utils.mock import MockType, is_mock_enabled
@@ -8,11 +9,13 @@ from krkn_ai.models.custom_errors import PrometheusConnectionError
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
 def is_openshift(kubeconfig: str) -> bool:
     """
     Checks if the targeted cluster is an OpenShift cluster.
 
     Attempts to query OpenShift cluster versions via the Kubernetes Python client.
+    The answer is cached per kubeconfig path for the lifetime of the process.
 
     Args:
         kubeconfig: Path to the Kubernetes configuration file.
@@ -126,7 +129,7 @@ def _discover_openshift_prometheus_url(kubeconfig: str) -> str:
         host = items[0].get("spec", {}).get("host", "").strip()
         return host
     except Exception as e:
-        logger.debug(f"Unexpected error during URL discovery: {e}")
+        logger.debug("Unexpected error during URL discovery: %s", e)
         return ""
 
 
@@ -141,14 +144,13 @@ def _discover_openshift_prometheus_token(kubeconfig: str) -> str:
         The authentication token or an empty string if discovery fails.
     """
     try:
-        config.load_kube_config(config_file=kubeconfig)
         api_client = config.new_client_from_config(config_file=kubeconfig)
         token = api_client.configuration.api_key.get("authorization")
         if token:
             return token.replace("Bearer ", "")
         return ""
     except Exception as e:
-        logger.debug(f"Unexpected error during token discovery: {e}")
+        logger.debug("Unexpected error during token discovery: %s", e)
         return ""
 
 
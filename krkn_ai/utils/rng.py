@@ -1,14 +1,32 @@
+"""
+Seeded random number generation for the genetic algorithm.
+
+Seeds are not compatible across versions. Batching random() into
+numpy blocks, serving pick() on short option tuples from a stdlib
+random.Random, and drawing percentage mutations in one step all changed
+the order of draws. A seed saved with an earlier version runs without
+error but produces a different sequence of scenarios.
+"""
+
+import random
 import numpy as np
 from typing import List, Optional
 from typing import TypeVar, Sequence
 
 T = TypeVar("T")
 
+# Number of floats RNG.random() draws from numpy at once; the GA calls it for
+# every crossover/mutation decision, so per-call numpy dispatch adds up.
+RANDOM_BATCH_SIZE = 1024
+
 
 class RNG:
     def __init__(self, seed: Optional[int] = None):
         self.seed = seed
         self.rng = np.random.default_rng(seed=seed)
+        self.py_rng = random.Random(seed)
+        self._random_buffer: List[float] = []
+        self._random_pos = 0
 
     def get_seed(self) -> Optional[int]:
         """Return the seed used to initialize the RNG, or None if no seed was set."""
@@ -18,9 +36,18 @@ class RNG:
         """Reset the RNG with a new seed."""
         self.seed = seed
         self.rng = np.random.default_rng(seed=seed)
+        self.py_rng = random.Random(seed)
+        self._random_buffer = []
+        self._random_pos = 0
 
-    def random(self):
-        return self.rng.random()
+    def random(self) -> float:
+        """Return a uniform float in [0, 1), served from a block of numpy draws."""
+        if self._random_pos >= len(self._random_buffer):
+            self._random_buffer = self.rng.random(RANDOM_BATCH_SIZE).tolist()
+            self._random_pos = 0
+        value = self._random_buffer[self._random_pos]
+        self._random_pos += 1
+        return value
 
     def choice(self, items: Sequence[T]) -> T:
         """Return a random element from the given non-empty sequence. The return type is inferred from the list type."""
@@ -29,10 +56,20 @@ class RNG:
         idx = self.rng.integers(0, len(items))
         return items[idx]
 
+    def pick(self, items: Sequence[T]) -> T:
+        """Return a random element from a short sequence such as a literal tuple.
+
+        Uses the stdlib generator, which is several times cheaper per call than a
+        numpy scalar draw when there are only a handful of options.
+        """
+        return self.py_rng.choice(items)
+
     def choices(self, items: Sequence[T], weights: List[float], k: int = 1) -> List[T]:
         if len(items) == 0:
             raise ValueError("Cannot select from an empty sequence")
-        indices = list(self.rng.choice(len(items), p=weights, size=k))
+        # Draw indices rather than items so numpy never builds an object array;
+        # tolist() converts them to Python ints in one C pass.
+        indices = self.rng.choice(len(items), p=weights, size=k).tolist()
         return [items[i] for i in indices]
 
     def randint(self, low: int, high: int) -> int:
@@ -49,7 +86,7 @@ class RNG:
 
     def sample(self, items: Sequence[T], k: int) -> List[T]:
         """Return k unique elements from items, without replacement."""
-        indices = self.rng.choice(len(items), size=k, replace=False)
+        indices = self.rng.choice(len(items), size=k, replace=False).tolist()
         return [items[i] for i in indices]
 
     def uniform(self, low: float, high: float):
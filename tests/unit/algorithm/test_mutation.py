@@ -23,9 +23,11 @@ class RecordingScenario(DummyScenario):
 
     received_components: ClassVar[List[ClusterComponents]] = []
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.received_components.append(self._cluster_components)
+    @classmethod
+    def construct_trusted(cls, **data):
+        scenario = super().construct_trusted(**data)
+        cls.received_components.append(scenario._cluster_components)
+        return scenario
 
 
 class TestMutation:
@@ -2,6 +2,8 @@
 ClusterManager unit tests
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -50,19 +52,23 @@ class TestClusterManager:
         # Mock namespace listing - need to provide pattern that matches
         mock_krkn_k8s.list_namespaces.return_value = ["default"]
 
-        # Mock pod listing
-        mock_pod = Mock()
-        mock_pod.metadata.name = "test-pod"
-        mock_pod.metadata.labels = {"app": "test"}
-        mock_owner_ref = Mock()
-        mock_owner_ref.kind = "ReplicaSet"
-        mock_owner_ref.name = "test-pod-abc123"
-        mock_pod.metadata.owner_references = [mock_owner_ref]
-        mock_container = Mock()
-        mock_container.name = "test-container"
-        mock_pod.spec = Mock()
-        mock_pod.spec.containers = [mock_container]
-        cluster_manager.core_api.list_namespaced_pod.return_value.items = [mock_pod]
+        # Mock pod listing (raw API response)
+        cluster_manager.core_api.list_namespaced_pod.return_value.data = json.dumps(
+            {
+                "items": [
+                    {
+                        "metadata": {
+                            "name": "test-pod",
+                            "labels": {"app": "test"},
+                            "ownerReferences": [
+                                {"kind": "ReplicaSet", "name": "test-pod-abc123"}
+                            ],
+                        },
+                        "spec": {"containers": [{"name": "test-container"}]},
+                    }
+                ]
+            }
+        )
 
         # Mock service listing
         mock_service = Mock()
@@ -301,29 +307,24 @@ class TestClusterManager:
         """Test list_pods filters pods by label patterns and skips pods by name patterns"""
         namespace = Namespace(name="test-ns")
 
-        # Create mock pods
-        mock_pod1 = Mock()
-        mock_pod1.metadata.name = "app-pod"
-        mock_pod1.metadata.labels = {"app": "myapp", "env": "prod"}
-        mock_pod1.metadata.owner_references = None
-        mock_container1 = Mock()
-        mock_container1.name = "container1"
-        mock_pod1.spec = Mock()
-        mock_pod1.spec.containers = [mock_container1]
-
-        mock_pod2 = Mock()
-        mock_pod2.metadata.name = "skip-me"
-        mock_pod2.metadata.labels = {"app": "myapp"}
-        mock_pod2.metadata.owner_references = None
-        mock_container2 = Mock()
-        mock_container2.name = "container2"
-        mock_pod2.spec = Mock()
-        mock_pod2.spec.containers = [mock_container2]
-
-        cluster_manager.core_api.list_namespaced_pod.return_value.items = [
-            mock_pod1,
-            mock_pod2,
-        ]
+        # Raw API response with two pods
+        cluster_manager.core_api.list_namespaced_pod.return_value.data = json.dumps(
+            {
+                "items": [
+                    {
+                        "metadata": {
+                            "name": "app-pod",
+                            "labels": {"app": "myapp", "env": "prod"},
+                        },
+                        "spec": {"containers": [{"name": "container1"}]},
+                    },
+                    {
+                        "metadata": {"name": "skip-me", "labels": {"app": "myapp"}},
+                        "spec": {"containers": [{"name": "container2"}]},
+                    },
+                ]
+            }
+        )
 
         # Test filtering by label pattern and skipping by name pattern
         # Note: skip_pod_name_patterns now accepts string patterns
@@ -334,6 +335,13 @@ class TestClusterManager:
         assert len(pods) == 1
         assert pods[0].name == "app-pod"
         assert pods[0].labels == {"app": "myapp"}
+        assert [c.name for c in pods[0].containers] == ["container1"]
+        assert pods[0].owner is None
+        cluster_manager.core_api.list_namespaced_pod.assert_called_once_with(
+            namespace="test-ns",
+            field_selector="status.phase=Running",
+            _preload_content=False,
+        )
 
     def test_list_services_handles_ports_correctly(self, cluster_manager):
         """Test list_services processes service ports and handles None port values"""
@@ -368,20 +376,15 @@ class TestClusterManager:
     def test_list_containers_extracts_container_names_from_pod_spec(
         self, cluster_manager
     ):
-        """Test list_containers extracts container names from pod spec"""
-        mock_container1 = Mock()
-        mock_container1.name = "container1"
-        mock_container2 = Mock()
-        mock_container2.name = "container2"
-
-        mock_pod_spec = Mock()
-        mock_pod_spec.containers = [mock_container1, mock_container2]
+        """Test list_containers extracts container names from a raw pod spec"""
+        pod_spec = {"containers": [{"name": "container1"}, {"name": "container2"}]}
 
-        containers = cluster_manager.list_containers(mock_pod_spec)
+        containers = cluster_manager.list_containers(pod_spec)
 
         assert len(containers) == 2
         assert containers[0].name == "container1"
         assert containers[1].name == "container2"
+        assert cluster_manager.list_containers({}) == []
 
     def test_list_nodes_filters_labels_and_handles_taints_and_metrics(
         self, cluster_manager
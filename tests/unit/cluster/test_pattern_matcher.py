@@ -312,3 +312,19 @@ class TestPatternMatcherEdgeCases:
         matcher = PatternMatcher.from_string("!kube-system")
         # Has implicit match_all, so not empty
         assert not matcher.is_empty()
+
+    def test_multiple_includes_behave_like_separate_patterns(self):
+        """Test merged include patterns match exactly what each pattern matches"""
+        matcher = PatternMatcher.from_string("openshift-.*,default,(a)\\1")
+        assert matcher.matches("openshift-etcd")
+        assert matcher.matches("default")
+        assert matcher.matches("aa")
+        assert not matcher.matches("kube-system")
+
+    def test_add_include_extends_existing_matcher(self):
+        """Test add_include takes effect after the matcher has been used"""
+        matcher = PatternMatcher.from_string("node-role.*")
+        assert not matcher.matches("kubernetes.io/hostname")
+        matcher.add_include("kubernetes.io/hostname")
+        assert matcher.matches("kubernetes.io/hostname")
+        assert matcher.matches("node-role.kubernetes.io/worker")
@@ -1,10 +1,10 @@
 """
-Tests for resolve_pod_name in pvc_utils
+Tests for resolve_pod_name and get_pvc_usage_percentage in pvc_utils
 """
 
 from unittest.mock import Mock, patch
 from krkn_ai.cluster import pvc_utils
-from krkn_ai.cluster import resolve_pod_name
+from krkn_ai.cluster import get_pvc_usage_percentage, resolve_pod_name
 
 
 class TestResolvePodName:
@@ -12,6 +12,7 @@ class TestResolvePodName:
 
     def setup_method(self):
         pvc_utils._kubeconfig_path = None
+        pvc_utils._kubernetes_clients.clear()
 
     def test_returns_stored_name_when_no_kubeconfig(self):
         assert (
@@ -105,3 +106,102 @@ class TestResolvePodName:
             "robot-shop", "cart-v1-old", "ReplicaSet", "cart-v1-abc"
         )
         assert result == "cart-v1-new"
+
+    @patch("krkn_ai.cluster.pvc_utils.KrknKubernetes")
+    def test_reuses_kubernetes_client_across_calls(self, mock_krkn_cls):
+        pvc_utils._kubeconfig_path = "/tmp/kubeconfig"
+        mock_krkn_cls.return_value.cli.list_namespaced_pod.return_value.items = []
+
+        resolve_pod_name("robot-shop", "cart-old", "ReplicaSet", "cart-abc")
+        resolve_pod_name("robot-shop", "user-old", "ReplicaSet", "user-abc")
+
+        mock_krkn_cls.assert_called_once_with(kubeconfig_path="/tmp/kubeconfig")
+        assert mock_krkn_cls.return_value.cli.list_namespaced_pod.call_count == 2
+
+
+def _pvc_volume(name, claim_name):
+    volume = Mock()
+    volume.name = name
+    volume.persistent_volume_claim.claim_name = claim_name
+    return volume
+
+
+class TestGetPvcUsagePercentage:
+    """Test get_pvc_usage_percentage function"""
+
+    def setup_method(self):
+        pvc_utils._kubeconfig_path = "/tmp/kubeconfig"
+        pvc_utils._kubernetes_clients.clear()
+        pvc_utils._telemetry_clients.clear()
+        pvc_utils._pvc_usage_cache.clear()
+        pvc_utils._pvc_mount_cache.clear()
+
+    @patch("krkn_ai.cluster.pvc_utils.KrknTelemetryKubernetes")
+    @patch("krkn_ai.cluster.pvc_utils.KrknKubernetes")
+    def test_pvcs_in_one_namespace_share_a_pod_listing(
+        self, mock_krkn_cls, mock_telemetry_cls
+    ):
+        pod = Mock()
+        pod.metadata.name = "db-0"
+        pod.spec.volumes = [
+            _pvc_volume("data", "data-pvc"),
+            _pvc_volume("logs", "logs-pvc"),
+        ]
+        list_pods = mock_krkn_cls.return_value.cli.list_namespaced_pod
+        list_pods.return_value.items = [pod]
+
+        container = Mock()
+        container.name = "db"
+        container.volumeMounts = []
+        for volume_name in ("data", "logs"):
+            mount = Mock(mountPath=f"/{volume_name}")
+            mount.name = volume_name
+            container.volumeMounts.append(mount)
+        lib_kubernetes = mock_telemetry_cls.return_value.get_lib_kubernetes.return_value
+        lib_kubernetes.get_pod_info.return_value = Mock(containers=[container])
+        lib_kubernetes.exec_cmd_in_pod.return_value = (
+            "/dev/sda 100 25 75 25% /data\n/dev/sdb 200 150 50 75% /logs\n"
+        )
+
+        assert get_pvc_usage_percentage("data-pvc", "shop") == 25.0
+        assert get_pvc_usage_percentage("logs-pvc", "shop") == 75.0
+        assert get_pvc_usage_percentage("missing-pvc", "shop") is None
+
+        assert list_pods.call_count == 1
+        mock_krkn_cls.assert_called_once_with(kubeconfig_path="/tmp/kubeconfig")
+        # Both PVCs of the container were measured by one df exec
+        lib_kubernetes.exec_cmd_in_pod.assert_called_once_with(
+            ["df /data /logs -B 1024 | sed 1d"], "db-0", "shop", "db"
+        )
+
+    @patch("krkn_ai.cluster.pvc_utils.KrknTelemetryKubernetes")
+    @patch("krkn_ai.cluster.pvc_utils.KrknKubernetes")
+    def test_unpairable_df_output_falls_back_to_single_probe(
+        self, mock_krkn_cls, mock_telemetry_cls
+    ):
+        pod = Mock()
+        pod.metadata.name = "db-0"
+        pod.spec.volumes = [
+            _pvc_volume("data", "data-pvc"),
+            _pvc_volume("logs", "logs-pvc"),
+        ]
+        mock_krkn_cls.return_value.cli.list_namespaced_pod.return_value.items = [pod]
+
+        container = Mock()
+        container.name = "db"
+        container.volumeMounts = []
+        for volume_name in ("data", "logs"):
+            mount = Mock(mountPath=f"/{volume_name}")
+            mount.name = volume_name
+            container.volumeMounts.append(mount)
+        lib_kubernetes = mock_telemetry_cls.return_value.get_lib_kubernetes.return_value
+        lib_kubernetes.get_pod_info.return_value = Mock(containers=[container])
+        lib_kubernetes.exec_cmd_in_pod.side_effect = [
+            "unexpected output",
+            "/dev/sda 100 40 60 40% /data",
+        ]
+
+        assert get_pvc_usage_percentage("data-pvc", "shop") == 40.0
+        assert lib_kubernetes.exec_cmd_in_pod.call_args.args[0] == [
+            "df /data -B 1024 | sed 1d"
+        ]
@@ -2,17 +2,32 @@
 BaseScenario and CompositeScenario model tests
 """
 
+import copy
+from dataclasses import fields
+from typing import ClassVar
+
+import pytest
+from pydantic import ValidationError
+
 from krkn_ai.models.scenario.base import (
     BaseParameter,
+    parameter_dataclass,
     CompositeScenario,
     CompositeDependency,
 )
-from krkn_ai.models.cluster_components import ClusterComponents
+from krkn_ai.models.cluster_components import (
+    ClusterComponents,
+    OwnerReference,
+    Pod,
+)
+from krkn_ai.models.scenario.scenario_dns_outage import DnsOutageScenario
 from krkn_ai.models.scenario.scenario_dummy import DummyScenario
 from krkn_ai.models.scenario.parameters import (
+    DummyEndParameter,
     IOBlockSizeParameter,
     IOWriteBytesParameter,
     NetworkScenarioEgressParamsParameter,
+    NodeCPUPercentageParameter,
     NetworkScenarioNetworkParamsParameter,
     NodeMemoryPercentageParameter,
     PodNameParameter,
@@ -21,25 +36,54 @@ from krkn_ai.models.scenario.parameters import (
 )
 
 
+@parameter_dataclass
+class _TestParameter(BaseParameter):
+    krknctl_name: ClassVar[str] = "test-param"
+    krknhub_name: ClassVar[str] = "TEST_PARAM"
+
+
 class TestBaseParameter:
     """Test BaseParameter model"""
 
     def test_get_name_returns_correct_name_based_on_parameter(self):
         """Test that get_name returns krknctl_name by default and krknhub_name when requested"""
-        param = BaseParameter(
-            krknctl_name="test-param", krknhub_name="TEST_PARAM", value=42
-        )
+        param = _TestParameter(value=42)
         # Test default behavior (krknctl_name)
         assert param.get_name() == "test-param"
         assert param.get_name(return_krknhub_name=False) == "test-param"
         # Test with return_krknhub_name=True
         assert param.get_name(return_krknhub_name=True) == "TEST_PARAM"
 
+    def test_names_are_class_constants_not_fields(self):
+        """Only value is a per-instance field; names live on the class"""
+        assert [f.name for f in fields(PodNameParameter) if f.init] == ["value"]
+        assert PodNameParameter.krknhub_name == "POD_NAME"
+
+    def test_private_parameter_state_is_not_serialized(self):
+        """Underscore fields such as the pod owner never reach scenario dumps"""
+        scenario = DnsOutageScenario.construct_trusted(
+            cluster_components=ClusterComponents(), mutate_on_init=False
+        )
+        pod = Pod(name="web-1", owner=OwnerReference(kind="ReplicaSet", name="web"))
+        scenario.pod_name.set_pod("ns", pod)
+
+        dumped = scenario.model_dump()
+        assert dumped["pod_name"]["value"] == "web-1"
+        for name in scenario.parameter_names:
+            assert not any(key.startswith("_") for key in dumped[name])
+
+    def test_names_are_kept_when_serializing_scenarios(self):
+        """Scenario dumps still carry each parameter's krknctl/krknhub names"""
+        scenario = DummyScenario(cluster_components=ClusterComponents())
+        assert scenario.model_dump()["end"] == {
+            "krknctl_name": "duration",
+            "krknhub_name": "END",
+            "value": scenario.end.value,
+        }
+
     def test_get_value_returns_parameter_value(self):
         """Test that get_value returns the parameter value"""
-        param = BaseParameter(
-            krknctl_name="test", krknhub_name="TEST", value="test-value"
-        )
+        param = _TestParameter(value="test-value")
         assert param.get_value() == "test-value"
 
     def test_parameter_overrides_accept_krknhub_value_formatting(self):
@@ -58,6 +102,61 @@ class TestBaseParameter:
         for parameter in parameters:
             assert parameter.get_value(return_krknhub_name=True) is not None
 
+    def test_parameters_are_slotted_and_copy_independently(self):
+        """Parameters carry no instance __dict__ and deepcopy without sharing state"""
+        param = PodNameParameter(value="pod-a")
+        assert not hasattr(param, "__dict__")
+
+        clone = copy.deepcopy(param)
+        clone.value = "pod-b"
+        assert param.value == "pod-a"
+        assert param.get_name(return_krknhub_name=True) == "POD_NAME"
+
+    def test_network_params_value_formatting(self):
+        """Network and egress params render as a single brace-wrapped mapping"""
+        network = NetworkScenarioNetworkParamsParameter()
+        egress = NetworkScenarioEgressParamsParameter()
+        assert network.get_value() == "{latency: 50ms,bandwidth: 100mbit}"
+        assert egress.get_value() == "{latency: 50ms,loss: 0.02,bandwidth: 100mbit}"
+
+        egress.mutate()
+        assert 0.01 <= egress.value.loss <= 0.1
+        assert network.value is not egress.value
+
+    def test_io_block_size_formatting_tracks_value_changes(self):
+        """IO block size renders with b/k/m suffixes and follows reassignment"""
+        param = IOBlockSizeParameter()
+        assert param.get_value() == "1m"
+        param.value = 512 * 1024
+        assert param.get_value() == "512k"
+        param.value = 1000
+        assert param.get_value() == "1000b"
+        assert param == IOBlockSizeParameter(value=1000)
+        assert [f.name for f in fields(param)] == ["value"]
+
+    def test_percentage_mutation_steps_both_ways_within_bounds(self):
+        """Percentage parameters step up and down and stay clamped"""
+        cases = ((NodeCPUPercentageParameter(), 20), (IOWriteBytesParameter(), 1))
+        for param, lower in cases:
+            seen_up = seen_down = False
+            # Restart from fixed values: small values can get stuck at the lower
+            # bound, where an integer step rounds to zero.
+            for i in range(300):
+                previous = param.value = (lower, 50, 100)[i % 3]
+                param.mutate()
+                assert lower <= param.value <= 100
+                seen_up |= param.value > previous
+                seen_down |= param.value < previous
+            assert seen_up and seen_down
+
+    def test_scenario_defaults_are_not_shared_between_instances(self):
+        """Each scenario instance gets its own copy of default parameters"""
+        cluster = ClusterComponents(namespaces=[], nodes=[])
+        first = DummyScenario(cluster_components=cluster)
+        second = DummyScenario(cluster_components=cluster)
+        first.end.value = 99
+        assert second.end.value == 10
+
 
 class TestScenario:
     """Test Scenario model"""
@@ -70,6 +169,40 @@ class TestScenario:
         assert scenario.krknctl_name == "dummy-scenario"
         assert scenario._cluster_components == cluster
 
+    def test_scenario_init_validates_fields(self):
+        """Scenarios built through __init__ still reject invalid data"""
+        with pytest.raises(ValidationError):
+            DummyScenario(cluster_components=ClusterComponents(), parent_ids="p1")
+
+    def test_construct_trusted_fills_defaults_without_validation(self):
+        """Trusted scenarios get fresh ids and unset fields"""
+        cluster = ClusterComponents(namespaces=[], nodes=[])
+        first = DummyScenario.construct_trusted(cluster_components=cluster)
+        second = DummyScenario.construct_trusted(
+            cluster_components=cluster, parent_ids=["p1"]
+        )
+
+        assert first.id != second.id
+        assert first.model_fields_set == set()
+        assert second.model_fields_set == {"parent_ids"}
+        assert second.parent_ids == ["p1"]
+        assert second._cluster_components is cluster
+
+    def test_parameters_are_cached_and_follow_field_reassignment(self):
+        """parameters is built once, rebuilt on reassignment, and deep-copies along"""
+        scenario = DummyScenario(cluster_components=ClusterComponents())
+        params = scenario.parameters
+        assert params == (scenario.end, scenario.exit_status)
+        assert scenario.parameters is params
+
+        scenario.end = DummyEndParameter(value=42)
+        assert scenario.parameters[0] is scenario.end
+
+        clone = copy.deepcopy(scenario)
+        clone.parameters[0].value = 7
+        assert clone.end.value == 7
+        assert scenario.end.value == 42
+
     def test_scenario_equality_and_hash(self):
         """Test that Scenario equality and hash compare name and parameter values"""
         cluster = ClusterComponents(namespaces=[], nodes=[])
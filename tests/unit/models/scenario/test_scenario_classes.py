@@ -67,6 +67,15 @@ class TestPodScenario:
             "app=" in scenario.pod_label.value or "version=" in scenario.pod_label.value
         )
 
+    def test_pod_scenario_can_skip_mutation_on_init(self):
+        """Test mutate_on_init=False keeps defaults and defers cluster checks"""
+        cluster = ClusterComponents(namespaces=[], nodes=[])
+
+        scenario = PodScenario(cluster_components=cluster, mutate_on_init=False)
+        assert scenario.namespace.value == ""
+        with pytest.raises(ScenarioParameterInitError):
+            scenario.mutate()
+
     def test_pod_scenario_raises_error_when_no_pods_with_labels(self):
         """Test that PodScenario raises ScenarioParameterInitError when no pods have labels"""
         pod = Pod(name="test-pod", labels={}, containers=[])
@@ -394,6 +403,23 @@ class TestTimeScenario:
         assert scenario.object_type.value in ["pod", "node"]
         assert scenario.label_selector.value != ""
 
+    def test_time_scenario_label_choice_is_reproducible(self):
+        """Test TimeScenario picks the same selector for the same seed"""
+        from krkn_ai.utils.rng import rng
+
+        pods = [Pod(name=f"p{i}", labels={"app": f"a{i}"}) for i in range(5)]
+        nodes = [Node(name=f"n{i}", labels={"zone": f"z{i}"}) for i in range(5)]
+        cluster = ClusterComponents(
+            namespaces=[Namespace(name="ns", pods=pods)], nodes=nodes
+        )
+
+        rng.set_seed(3)
+        first = TimeScenario(cluster_components=cluster).label_selector.value
+        rng.set_seed(3)
+        second = TimeScenario(cluster_components=cluster).label_selector.value
+        rng.set_seed(None)
+        assert first == second
+
     def test_time_scenario_raises_error_when_no_labels(self):
         """Test that TimeScenario raises error when no labels exist"""
         pod = Pod(name="test-pod", labels={}, containers=[])
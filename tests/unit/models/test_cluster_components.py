@@ -11,6 +11,7 @@ from krkn_ai.models.cluster_components import (
     ServicePort,
     PVC,
     Node,
+    VMI,
 )
 
 
@@ -133,6 +134,24 @@ class TestService:
         assert service.ports[0].target_port == 8080
         assert service.ports[1].target_port == "8443"
 
+    def test_service_port_indices_are_cached(self):
+        """Test port_numbers and services_with_ports skip empty entries"""
+        service = Service(
+            name="web", ports=[ServicePort(port=0), ServicePort(port=8080)]
+        )
+        namespace = Namespace(name="ns", services=[Service(name="bare"), service])
+        assert service.port_numbers == (8080,)
+        assert service.port_numbers is service.port_numbers
+        assert namespace.services_with_ports == (service,)
+
+        service.ports = [ServicePort(port=443)]
+        namespace.services = [
+            service,
+            Service(name="api", ports=[ServicePort(port=80)]),
+        ]
+        assert service.port_numbers == (443,)
+        assert [s.name for s in namespace.services_with_ports] == ["web", "api"]
+
 
 class TestNode:
     """Test Node model"""
@@ -177,3 +196,309 @@ class TestPVC:
         # Test with usage percentage
         pvc = PVC(name="test-pvc", current_usage_percentage=85.5)
         assert pvc.current_usage_percentage == 85.5
+
+
+class TestLabelInterning:
+    """Test that label keys/values are interned at load time"""
+
+    def test_equal_labels_share_string_objects(self):
+        """Test equal labels on different objects resolve to the same string object"""
+        # Build strings at runtime so they are not compile-time constants
+        key_a, key_b = "".join(["a", "pp"]), "".join(["ap", "p"])
+        value_a, value_b = "".join(["fr", "ontend"]), "".join(["front", "end"])
+        assert key_a is not key_b
+
+        pod = Pod(name="pod", labels={key_a: value_a})
+        node = Node(name="node", labels={key_b: value_b})
+
+        pod_key = next(iter(pod.labels))
+        node_key = next(iter(node.labels))
+        assert pod_key is node_key
+        assert pod.labels[pod_key] is node.labels[node_key]
+
+
+class TestActiveNodes:
+    """Test active node iteration"""
+
+    def test_iter_active_nodes_skips_disabled(self):
+        """Test iter_active_nodes only yields enabled nodes"""
+        cluster = ClusterComponents(
+            nodes=[
+                Node(name="node-1"),
+                Node(name="node-2", disabled=True),
+                Node(name="node-3"),
+            ]
+        )
+        assert [n.name for n in cluster.iter_active_nodes()] == ["node-1", "node-3"]
+
+
+class TestLeafComponents:
+    """Test dataclass-backed leaf components inside pydantic models"""
+
+    def test_leaf_components_validated_from_dicts(self):
+        """Test nested dicts are validated into leaf dataclasses"""
+        pod = Pod.model_validate(
+            {
+                "name": "pod",
+                "containers": [{"name": "c1"}],
+                "owner": {"kind": "ReplicaSet", "name": "rs-1"},
+            }
+        )
+        assert pod.containers == [Container(name="c1")]
+        assert pod.owner.kind == "ReplicaSet"
+
+        service = Service.model_validate(
+            {"name": "svc", "ports": [{"port": 80, "target_port": "http"}]}
+        )
+        assert service.ports == [ServicePort(port=80, target_port="http")]
+
+    def test_leaf_components_dump_without_defaults(self):
+        """Test leaf dataclasses honour exclude_defaults when dumped"""
+        pod = Pod(name="pod", containers=[Container(name="c1")])
+        data = pod.model_dump(mode="json", exclude_defaults=True)
+        assert data == {"name": "pod", "containers": [{"name": "c1"}]}
+
+    def test_leaf_components_use_slots(self):
+        """Test leaf dataclasses carry no per-instance __dict__"""
+        assert not hasattr(Container(name="c1"), "__dict__")
+        assert not hasattr(ServicePort(port=80), "__dict__")
+
+
+class TestPodIndex:
+    """Test cached (namespace, pod) pair tuples"""
+
+    def test_pod_pairs_are_filtered_and_cached(self):
+        """Test all_pods / labelled_pods / labelled_pods_with_containers"""
+        labelled = Pod(
+            name="labelled", labels={"app": "a"}, containers=[Container(name="c")]
+        )
+        no_containers = Pod(name="no-containers", labels={"app": "b"})
+        unlabelled = Pod(name="unlabelled")
+        namespace = Namespace(name="ns", pods=[labelled, no_containers, unlabelled])
+        cluster = ClusterComponents(namespaces=[namespace])
+
+        assert [p.name for _, p in cluster.all_pods] == [
+            "labelled",
+            "no-containers",
+            "unlabelled",
+        ]
+        assert [p.name for _, p in cluster.labelled_pods] == [
+            "labelled",
+            "no-containers",
+        ]
+        assert [p.name for _, p in cluster.labelled_pods_with_containers] == [
+            "labelled"
+        ]
+        assert all(ns is namespace for ns, _ in cluster.all_pods)
+        assert cluster.labelled_pods is cluster.labelled_pods
+
+    def test_pod_pairs_are_rebuilt_after_edits(self):
+        """Test pod pair caches follow field edits on the cluster and its children"""
+        namespace = Namespace(name="ns", pods=[Pod(name="a", labels={"app": "a"})])
+        cluster = ClusterComponents(namespaces=[namespace])
+        assert len(cluster.all_pods) == 1
+
+        namespace.pods = namespace.pods + [Pod(name="b")]
+        assert [p.name for _, p in cluster.all_pods] == ["a", "b"]
+        assert [p.name for _, p in cluster.labelled_pods] == ["a"]
+
+        namespace.pods[1].labels = {"app": "b"}
+        assert [p.name for _, p in cluster.labelled_pods] == ["a", "b"]
+
+        cluster.namespaces = []
+        assert cluster.all_pods == ()
+
+    def test_pod_pairs_are_rebuilt_after_in_place_edits(self):
+        """Test pod pair caches follow appends and label edits made in place"""
+        namespace = Namespace(name="ns", pods=[Pod(name="a", labels={"app": "a"})])
+        cluster = ClusterComponents(namespaces=[namespace])
+        assert len(cluster.all_pods) == 1
+        assert len(cluster.labelled_pods) == 1
+
+        namespace.pods.append(Pod(name="b"))
+        assert [p.name for _, p in cluster.all_pods] == ["a", "b"]
+        assert [p.name for _, p in cluster.labelled_pods] == ["a"]
+
+        namespace.pods[1].labels["app"] = "b"
+        assert [p.name for _, p in cluster.labelled_pods] == ["a", "b"]
+
+        cluster.namespaces.append(Namespace(name="other", pods=[Pod(name="c")]))
+        assert [p.name for _, p in cluster.all_pods] == ["a", "b", "c"]
+
+        del namespace.pods[0]
+        assert [p.name for _, p in cluster.all_pods] == ["b", "c"]
+
+        # Lists assigned after construction are tracked as well
+        namespace.pods = []
+        namespace.pods.append(Pod(name="d"))
+        assert [p.name for _, p in cluster.all_pods] == ["d", "c"]
+
+    def test_namespace_resource_indices(self):
+        """Test all_pvcs / all_vmis / namespaces_with_services(_ports)"""
+        portless = Namespace(name="portless", services=[Service(name="headless")])
+        served = Namespace(
+            name="served",
+            services=[Service(name="web", ports=[ServicePort(port=80)])],
+            pvcs=[PVC(name="data")],
+            vmis=[VMI(name="vm")],
+        )
+        cluster = ClusterComponents(namespaces=[portless, served])
+
+        assert [(ns.name, p.name) for ns, p in cluster.all_pvcs] == [("served", "data")]
+        assert [(ns.name, v.name) for ns, v in cluster.all_vmis] == [("served", "vm")]
+        assert cluster.namespaces_with_services == (portless, served)
+        assert cluster.namespaces_with_service_ports == (served,)
+        assert cluster.all_pvcs is cluster.all_pvcs
+
+        portless.pvcs = [PVC(name="scratch")]
+        served.vmis = []
+        assert [p.name for _, p in cluster.all_pvcs] == ["scratch", "data"]
+        assert cluster.all_vmis == ()
+
+        cluster.namespaces = [served]
+        assert cluster.namespaces_with_services == (served,)
+
+    def test_container_names_are_cached_in_order(self):
+        """Test Pod.container_names preserves order and is computed once"""
+        pod = Pod(name="p", containers=[Container(name="b"), Container(name="a")])
+        assert pod.container_names == ("b", "a")
+        assert pod.container_names is pod.container_names
+        assert Pod(name="empty").container_names == ()
+
+        pod.containers = [Container(name="c")]
+        assert pod.container_names == ("c",)
+
+
+class TestActiveComponentsCache:
+    """Test the shared active-components view"""
+
+    def test_active_view_is_built_once_and_shares_indices(self):
+        """Test get_active_components returns one filtered instance per snapshot"""
+        pod = Pod(name="p", labels={"app": "a"})
+        cluster = ClusterComponents(
+            namespaces=[
+                Namespace(name="ns", pods=[pod]),
+                Namespace(name="off", disabled=True),
+            ]
+        )
+
+        active = cluster.get_active_components()
+        assert [ns.name for ns in active.namespaces] == ["ns"]
+        assert cluster.get_active_components() is active
+        assert cluster.get_active_components().labelled_pods is active.labelled_pods
+
+    def test_active_view_is_rebuilt_after_edits(self):
+        """Test get_active_components reflects components disabled after the fact"""
+        pod = Pod(name="p")
+        cluster = ClusterComponents(namespaces=[Namespace(name="ns", pods=[pod])])
+        active = cluster.get_active_components()
+        assert [p.name for _, p in active.all_pods] == ["p"]
+
+        pod.disabled = True
+        rebuilt = cluster.get_active_components()
+        assert rebuilt is not active
+        assert rebuilt.all_pods == ()
+
+        cluster.namespaces[0].pods.append(Pod(name="q"))
+        assert [p.name for _, p in cluster.get_active_components().all_pods] == ["q"]
+
+        # Edits made through the shared view do not stick to the snapshot
+        rebuilt.namespaces = []
+        assert len(cluster.get_active_components().namespaces) == 1
+
+
+class TestNodeLabelIndex:
+    """Test the cached node label index"""
+
+    def test_node_label_index_groups_nodes_by_label(self):
+        """Test each key=value label maps to the nodes carrying it, in order"""
+        node1 = Node(name="node-1", labels={"zone": "a", "disk": "ssd"})
+        node2 = Node(name="node-2", labels={"zone": "b"})
+        node3 = Node(name="node-3", labels={"zone": "a"})
+        cluster = ClusterComponents(nodes=[node1, node2, node3])
+
+        index = cluster.node_label_index
+        assert list(index) == ["zone=a", "disk=ssd", "zone=b"]
+        assert index["zone=a"] == (node1, node3)
+        assert index["disk=ssd"] == (node1,)
+        assert cluster.node_label_index is index
+        assert cluster.node_label_keys == ("zone=a", "disk=ssd", "zone=b")
+        assert cluster.node_label_keys is cluster.node_label_keys
+
+    def test_node_label_index_is_rebuilt_after_node_edits(self):
+        """Test the label index follows edits to the cluster's nodes"""
+        cluster = ClusterComponents(nodes=[Node(name="node-1", labels={"zone": "a"})])
+        assert list(cluster.node_label_index) == ["zone=a"]
+
+        cluster.nodes = [Node(name="node-2", labels={"zone": "b"})]
+        assert list(cluster.node_label_index) == ["zone=b"]
+
+        cluster.nodes = []
+        assert cluster.node_label_index == {}
+        assert cluster.node_label_keys == ()
+
+    def test_namespace_pod_label_selectors_are_deduplicated(self):
+        """Test namespaces_with_pods and Namespace.pod_label_selectors"""
+        busy = Namespace(
+            name="busy",
+            pods=[
+                Pod(name="a", labels={"app": "web", "tier": "front"}),
+                Pod(name="b", labels={"app": "web"}),
+            ],
+        )
+        cluster = ClusterComponents(namespaces=[Namespace(name="empty"), busy])
+        assert cluster.namespaces_with_pods == (busy,)
+        assert busy.pod_label_selectors == ("app=web", "tier=front")
+        assert busy.pod_label_selectors is busy.pod_label_selectors
+
+        busy.pods[0].labels = {"app": "api"}
+        assert busy.pod_label_selectors == ("app=api", "app=web")
+        busy.pods = []
+        assert cluster.namespaces_with_pods == ()
+
+    def test_nodes_with_interfaces_are_cached(self):
+        """Test nodes_with_interfaces skips nodes without interfaces"""
+        wired = Node(name="wired", interfaces=["eth0"])
+        cluster = ClusterComponents(nodes=[Node(name="bare"), wired])
+        assert cluster.nodes_with_interfaces == (wired,)
+        assert cluster.nodes_with_interfaces is cluster.nodes_with_interfaces
+
+        wired.interfaces = []
+        assert cluster.nodes_with_interfaces == ()
+
+    def test_pod_label_keys_are_cached_in_order(self):
+        """Test Pod.label_keys follows label insertion order"""
+        pod = Pod(name="p", labels={"app": "web", "tier": "front"})
+        assert pod.label_keys == ("app", "tier")
+        assert pod.label_keys is pod.label_keys
+
+        pod.labels = {"tier": "back"}
+        assert pod.label_keys == ("tier",)
+
+    def test_label_selectors_are_cached_in_order(self):
+        """Test label_selectors formats "key=value" strings once per object"""
+        pod = Pod(name="p", labels={"app": "web", "tier": "front"})
+        node = Node(name="n", labels={"zone": "a"})
+        assert pod.label_selectors == ("app=web", "tier=front")
+        assert pod.label_selectors is pod.label_selectors
+        assert node.label_selectors == ("zone=a",)
+
+        cluster = ClusterComponents(nodes=[node])
+        assert list(cluster.node_label_index) == ["zone=a"]
+        node.labels = {"zone": "b"}
+        assert node.label_selectors == ("zone=b",)
+        assert list(cluster.node_label_index) == ["zone=b"]
+
+
+class TestNodeTaintsJson:
+    """Test the cached node taints JSON"""
+
+    def test_taints_json_is_cached(self):
+        """Test taints_json encodes taints once and handles empty taints"""
+        node = Node(name="n", taints=["dedicated=infra:NoSchedule"])
+        assert node.taints_json == '["dedicated=infra:NoSchedule"]'
+        assert node.taints_json is node.taints_json
+        assert Node(name="plain").taints_json == "[]"
+
+        node.taints = []
+        assert node.taints_json == "[]"
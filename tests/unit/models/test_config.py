@@ -117,6 +117,17 @@ class TestConfigFile:
                 fitness_function=FitnessFunction(query="test"),
             )
 
+    def test_invalid_cluster_components_rejected_at_load(self):
+        """Test a malformed cluster_components tree fails config validation"""
+        with pytest.raises(ValidationError):
+            ConfigFile.model_validate(
+                {
+                    "kubeconfig_file_path": "/path/to/kubeconfig",
+                    "fitness_function": {"query": "test_query"},
+                    "cluster_components": {"namespaces": [{"pods": []}]},
+                }
+            )
+
 
 class TestFitnessFunction:
     """Test FitnessFunction model validation"""
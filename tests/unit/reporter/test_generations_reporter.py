@@ -92,6 +92,8 @@ class TestGenerationsReporter:
             assert len(results) == 1
             assert results[0]["generation_id"] == 0
             assert results[0]["fitness_result"]["fitness_score"] == 15.0
+            assert results[0]["start_time"] == now.isoformat()
+            assert "log" not in results[0]
 
     def test_save_best_generation_graph_with_results(self, temp_output_dir):
         """Test generating best generation graph with valid data"""
@@ -114,21 +116,22 @@ class TestGenerationsReporter:
             for i in range(3)
         ]
 
-        with patch("krkn_ai.reporter.generations_reporter.plt") as mock_plt:
+        with patch("matplotlib.figure.Figure") as mock_figure:
             reporter.save_best_generation_graph(best_generations)
 
-            mock_plt.savefig.assert_called_once()
-            assert mock_plt.close.called
+            mock_figure.assert_called_once_with()
+            mock_figure.return_value.savefig.assert_called_once()
+            assert mock_figure.return_value.savefig.call_args.kwargs["dpi"] == 300
 
     def test_save_best_generation_graph_with_empty_list(self, temp_output_dir):
         """Test that empty list does not generate graph"""
         reporter = GenerationsReporter(output_dir=temp_output_dir, format="yaml")
 
-        with patch("krkn_ai.reporter.generations_reporter.plt") as mock_plt:
+        with patch("matplotlib.figure.Figure") as mock_figure:
             reporter.save_best_generation_graph([])
 
-            # Should not call savefig for empty list
-            mock_plt.savefig.assert_not_called()
+            # Should not build a figure for an empty list
+            mock_figure.assert_not_called()
             graph_path = os.path.join(
                 temp_output_dir, "reports", "graphs", "best_generation.png"
             )
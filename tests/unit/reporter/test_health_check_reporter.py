@@ -8,7 +8,7 @@ import datetime
 from unittest.mock import patch, MagicMock
 
 from krkn_ai.reporter.health_check_reporter import HealthCheckReporter
-from krkn_ai.models.app import CommandRunResult, FitnessResult
+from krkn_ai.models.app import CommandRunResult, FitnessResult, FitnessScoreResult
 from krkn_ai.models.config import HealthCheckResult
 from krkn_ai.models.scenario.scenario_dummy import DummyScenario
 from krkn_ai.models.cluster_components import ClusterComponents
@@ -196,25 +196,26 @@ class TestHealthCheckReporter:
             },
         )
 
-        with (
-            patch("krkn_ai.reporter.health_check_reporter.plt") as mock_plt,
-            patch("krkn_ai.reporter.health_check_reporter.sns") as mock_sns,
-        ):
-            # Mock subplots to return fig and axes
-            mock_fig = MagicMock()
+        with patch("matplotlib.figure.Figure") as mock_figure:
+            # Mock subplots to return the two axes
+            mock_fig = mock_figure.return_value
             mock_axes = [MagicMock(), MagicMock()]
-            mock_plt.subplots.return_value = (mock_fig, mock_axes)
+            mock_fig.subplots.return_value = mock_axes
 
             reporter.plot_report(result)
 
             graph_dir = os.path.join(temp_output_dir, "reports", "graphs")
             assert os.path.exists(graph_dir)
-            mock_plt.subplots.assert_called_once_with(2, 1, figsize=(15, 10))
-            mock_sns.lineplot.assert_called_once()
-            mock_sns.heatmap.assert_called_once()
-            mock_plt.tight_layout.assert_called_once()
-            mock_plt.savefig.assert_called_once()
-            mock_plt.close.assert_called_once()
+            mock_figure.assert_called_once_with(figsize=(15, 10))
+            mock_fig.subplots.assert_called_once_with(2, 1)
+            mock_axes[0].plot.assert_called_once()
+            mock_axes[1].imshow.assert_called_once()
+            mock_axes[1].grid.assert_called_once_with(
+                which="minor", color="gray", linewidth=0.3
+            )
+            mock_fig.tight_layout.assert_called_once()
+            mock_fig.savefig.assert_called_once()
+            assert mock_fig.savefig.call_args.kwargs["dpi"] == 300
 
     def test_plot_report_with_empty_health_check_results(self, temp_output_dir):
         """Test that empty health check results does not generate plot"""
@@ -235,11 +236,11 @@ class TestHealthCheckReporter:
             health_check_results={},
         )
 
-        with patch("krkn_ai.reporter.health_check_reporter.plt") as mock_plt:
+        with patch("matplotlib.figure.Figure") as mock_figure:
             reporter.plot_report(result)
 
-            # Should not call savefig for empty results
-            mock_plt.savefig.assert_not_called()
+            # Should not build a figure for empty results
+            mock_figure.assert_not_called()
 
     def test_plot_report_with_empty_sample_lists_in_health_check_results(
         self, temp_output_dir
@@ -265,10 +266,10 @@ class TestHealthCheckReporter:
             },
         )
 
-        with patch("krkn_ai.reporter.health_check_reporter.plt") as mock_plt:
+        with patch("matplotlib.figure.Figure") as mock_figure:
             # Should not raise KeyError: 'timestamp'
             reporter.plot_report(result)
-            mock_plt.savefig.assert_not_called()
+            mock_figure.assert_not_called()
 
     def test_write_fitness_result_creates_and_appends_csv(self, temp_output_dir):
         """Test writing fitness result creates CSV and appends subsequent results"""
@@ -313,6 +314,40 @@ class TestHealthCheckReporter:
         assert df.iloc[1]["generation_id"] == 1
         assert df.iloc[1]["fitness_score"] == 20.0
 
+    def test_write_fitness_result_widens_header_for_new_slos(self, temp_output_dir):
+        """Test a row with new SLO columns widens the header of earlier rows"""
+        reporter = HealthCheckReporter(output_dir=temp_output_dir)
+        scenario = DummyScenario(cluster_components=ClusterComponents())
+        now = datetime.datetime.now()
+
+        for generation_id, slo_id in enumerate([1, 2]):
+            reporter.write_fitness_result(
+                CommandRunResult(
+                    generation_id=generation_id,
+                    scenario=scenario,
+                    cmd="test-cmd",
+                    log="test-log",
+                    returncode=0,
+                    start_time=now,
+                    end_time=now,
+                    fitness_result=FitnessResult(
+                        scores=[
+                            FitnessScoreResult(
+                                id=slo_id, fitness_score=1.5, weighted_score=1.5
+                            )
+                        ]
+                    ),
+                )
+            )
+
+        df = pd.read_csv(os.path.join(temp_output_dir, "reports", "all.csv"))
+        assert len(df) == 2
+        assert list(df.columns[-1:]) == ["slo_2"]
+        assert df.iloc[0]["slo_1"] == 1.5
+        assert pd.isna(df.iloc[0]["slo_2"])
+        assert pd.isna(df.iloc[1]["slo_1"])
+        assert df.iloc[1]["slo_2"] == 1.5
+
     def test_sort_fitness_result_csv_sorts_by_fitness_score(self, temp_output_dir):
         """Test sorting CSV file by fitness score in descending order"""
         reporter = HealthCheckReporter(output_dir=temp_output_dir)
@@ -353,6 +388,33 @@ class TestHealthCheckReporter:
             for i in range(len(df) - 1)
         )
 
+    def test_sort_fitness_result_csv_keeps_order_of_equal_scores(self, temp_output_dir):
+        """Test rows with equal fitness scores keep their evaluation order"""
+        reporter = HealthCheckReporter(output_dir=temp_output_dir)
+        scenario = DummyScenario(cluster_components=ClusterComponents())
+        now = datetime.datetime.now()
+
+        for i, score in enumerate([1.0, 5.0, 1.0, 5.0]):
+            reporter.write_fitness_result(
+                CommandRunResult(
+                    generation_id=0,
+                    scenario_id=i,
+                    scenario=scenario,
+                    cmd=f"cmd-{i}",
+                    log=f"log-{i}",
+                    returncode=0,
+                    start_time=now,
+                    end_time=now,
+                    fitness_result=FitnessResult(fitness_score=score),
+                )
+            )
+
+        reporter.sort_fitness_result_csv()
+
+        report_path = os.path.join(temp_output_dir, "reports", "all.csv")
+        df = pd.read_csv(report_path)
+        assert df["scenario_id"].tolist() == [1, 3, 0, 2]
+
     def test_sort_fitness_result_csv_with_nonexistent_file(self, temp_output_dir):
         """Test sorting when CSV file does not exist"""
         reporter = HealthCheckReporter(output_dir=temp_output_dir)
@@ -61,6 +61,12 @@ class TestScenarioRendering:
         doc = yaml.safe_load(rendered)
         assert doc["allow_dangerous_scenarios"] is False
 
+    def test_cluster_components_round_trip(self):
+        """Nested cluster components are indented under cluster_components."""
+        data = {"namespaces": [{"name": "default", "pods": [{"name": "web"}]}]}
+        rendered = create_krkn_ai_template(KUBECONFIG, data, None)
+        assert yaml.safe_load(rendered)["cluster_components"] == data
+
 
 def _health_checks(rendered: str):
     """Return the health_checks mapping from rendered YAML (None if commented)."""
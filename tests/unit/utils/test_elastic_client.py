@@ -1,3 +1,4 @@
+import logging
 from unittest.mock import Mock, patch
 from krkn_ai.utils.elastic_client import ElasticSearchClient
 from krkn_ai.models.config import ElasticConfig
@@ -31,6 +32,24 @@ class TestElasticSearchClient:
         assert client.client is mock_instance
         mock_krkn_elastic.assert_called_once()
 
+    @patch(
+        "krkn_ai.utils.elastic_client.ElasticSearchClient._ElasticSearchClient__test_connection"
+    )
+    @patch("krkn_ai.utils.elastic_client.KrknElastic")
+    def test_repeated_clients_do_not_add_null_logger_handlers(
+        self, mock_krkn_elastic, mock_test_connection
+    ):
+        """Test that each new client does not add another null logger handler"""
+        mock_test_connection.return_value = True
+        null_logger = logging.getLogger("null")
+        handler_count = len(null_logger.handlers)
+
+        for _ in range(3):
+            ElasticSearchClient(self.config)
+
+        assert len(null_logger.handlers) == handler_count
+        assert mock_krkn_elastic.call_args.kwargs["safe_logger"] is null_logger
+
     @patch(
         "krkn_ai.utils.elastic_client.ElasticSearchClient._ElasticSearchClient__test_connection"
     )
@@ -7,6 +7,7 @@ import yaml
 from pydantic import ValidationError
 
 from krkn_ai.utils.fs import (
+    preprocess_param_string,
     read_config_from_file,
     save_discovery,
     merge_components,
@@ -53,6 +54,34 @@ class TestParamParsing:
         assert value == ""
 
 
+class TestPreprocessParamString:
+    def test_replaces_all_parameters(self):
+        """every $key occurrence is replaced with its value"""
+        data = "http://$HOST:$PORT/$HOST"
+        params = {"HOST": "example.com", "PORT": "8080"}
+        assert (
+            preprocess_param_string(data, params)
+            == "http://example.com:8080/example.com"
+        )
+
+    def test_longest_parameter_name_wins(self):
+        """$HOSTNAME is not clobbered by a shorter HOST parameter"""
+        params = {"HOST": "short", "HOSTNAME": "long"}
+        assert preprocess_param_string("$HOSTNAME/$HOST", params) == "long/short"
+
+    def test_substituted_values_are_not_expanded_again(self):
+        """a value containing $key is inserted literally"""
+        params = {"A": "$B", "B": "x"}
+        assert preprocess_param_string("$A $B", params) == "$B x"
+
+    def test_no_params_returns_string_unchanged(self):
+        assert preprocess_param_string("http://$HOST", {}) == "http://$HOST"
+
+    def test_string_without_placeholders_returns_unchanged(self):
+        params = {"HOST": "example.com"}
+        assert preprocess_param_string("http://localhost", params) == "http://localhost"
+
+
 class TestReadConfigFromFileHeaders:
     def _write_config(self, path):
         config = {
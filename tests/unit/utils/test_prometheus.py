@@ -12,6 +12,9 @@ from krkn_ai.models.custom_errors import PrometheusConnectionError
 class TestPrometheusUtils:
     """Tests for Prometheus utility functions."""
 
+    def setup_method(self):
+        is_openshift.cache_clear()
+
     @patch("krkn_ai.utils.prometheus.config.load_kube_config")
     @patch("krkn_ai.utils.prometheus.client.CustomObjectsApi")
     def test_is_openshift_positive(self, mock_api_class, mock_load):
@@ -29,6 +32,20 @@ class TestPrometheusUtils:
         mock_api.list_cluster_custom_object.side_effect = Exception("Not OpenShift")
         assert is_openshift("/tmp/test-kubeconfig") is False
 
+    @patch("krkn_ai.utils.prometheus.config.load_kube_config")
+    @patch("krkn_ai.utils.prometheus.client.CustomObjectsApi")
+    def test_is_openshift_cached_per_kubeconfig(self, mock_api_class, mock_load):
+        """Should query the cluster once per kubeconfig path."""
+        mock_api = mock_api_class.return_value
+        mock_api.list_cluster_custom_object.return_value = {"items": []}
+
+        assert is_openshift("/tmp/test-kubeconfig") is True
+        assert is_openshift("/tmp/test-kubeconfig") is True
+        assert mock_api.list_cluster_custom_object.call_count == 1
+
+        is_openshift("/tmp/other-kubeconfig")
+        assert mock_api.list_cluster_custom_object.call_count == 2
+
     @patch("krkn_ai.utils.prometheus.KrknPrometheus")
     def test_create_client_from_env_vars(self, mock_prom_class):
         """Should prioritize PROMETHEUS_URL and PROMETHEUS_TOKEN from environment."""
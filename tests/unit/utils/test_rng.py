@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from krkn_ai.utils.rng import RNG
+from krkn_ai.utils.rng import RANDOM_BATCH_SIZE, RNG
 
 
 class DummyPydanticModel(BaseModel):
@@ -49,6 +49,16 @@ class TestRNG:
         assert isinstance(val, float)
         assert 0.0 <= val < 1.0
 
+    def test_random_is_reproducible_across_batches(self):
+        """Test buffered random() replays the same stream after set_seed()."""
+        rng = RNG(7)
+        draws = [rng.random() for _ in range(RANDOM_BATCH_SIZE + 5)]
+        assert all(0.0 <= d < 1.0 for d in draws)
+        assert len(set(draws)) == len(draws)
+
+        rng.set_seed(7)
+        assert [rng.random() for _ in range(RANDOM_BATCH_SIZE + 5)] == draws
+
     def test_choice(self):
         """Test choice() picks an element from a sequence."""
         rng = RNG(42)
@@ -61,6 +71,16 @@ class TestRNG:
         choice2 = rng.choice(items)
         assert choice == choice2
 
+    def test_pick_is_reproducible_with_seed(self):
+        """Test pick() draws from the sequence and follows set_seed()."""
+        rng = RNG(42)
+        items = ("serial", "parallel")
+        picks = [rng.pick(items) for _ in range(20)]
+        assert set(picks) <= set(items)
+
+        rng.set_seed(42)
+        assert [rng.pick(items) for _ in range(20)] == picks
+
     def test_choice_pydantic_compatibility(self):
         """Test choice() works with Pydantic models (prevents NumPy array conversion failure)."""
         rng = RNG(42)
@@ -34,3 +34,10 @@ class TestRunShell:
         logs, returncode = run_shell("podman --version")
         assert returncode == 127
         assert logs == ""
+
+    @pytest.mark.parametrize("do_not_log", [True, False])
+    def test_output_is_returned_with_and_without_logging(self, do_not_log):
+        """Test both output collection paths return the full command output"""
+        logs, returncode = run_shell("printf 'a\\nb\\n'", do_not_log=do_not_log)
+        assert returncode == 0
+        assert logs == "a\nb\n"